@@ -0,0 +1,149 @@
+"""
+Benchmark Mini-AES
+Menjalankan: `uv run benchmark.py` (atau `python benchmark.py`)
+
+1. Startup: biaya import seluruh modul yang dimuat pemanggilan CLI nyata (dari
+   `python -X importtime main.py encrypt ...`) dan waktu total pemanggilan CLI singkat.
+   Gagal (exit code 1) jika biaya import melebihi anggaran.
+2. Throughput file: pemrosesan berurutan (baca -> cipher -> tulis) dibandingkan pipeline
+   berthread (pipeline.py), di disk lokal dan dengan latensi I/O buatan ala penyimpanan jaringan.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from io import BytesIO
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# Subprocess selalu boleh menulis .pyc, seperti pemakaian CLI sehari-hari
+ENV = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+
+# ---- Anggaran Startup ----
+# Biaya import (mikrodetik) semua modul yang dimuat satu pemanggilan CLI di luar modul
+# bawaan interpreter kosong: main, argparse, encrypt_decrypt, mini_aes_tables, dst.
+IMPORT_BUDGET_US = 30000
+STARTUP_ARGS = ["encrypt", "9C63", "C3F0"]
+STARTUP_RUNS = 15
+
+def import_times_us(argv):
+    """Mengembalikan {nama modul: biaya import sendiri (mikrodetik)} untuk satu pemanggilan interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        cwd=HERE, env=ENV, capture_output=True, text=True, check=True,
+    )
+    # Format baris: "import time: <self> | <cumulative> | <nama modul>"
+    times = {}
+    for line in result.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[1].isdigit():
+            times[parts[2]] = int(parts[0].rpartition(":")[2])
+    return times
+
+def cli_import_us(args):
+    """Biaya import (mikrodetik) pemanggilan `main.py`: jumlah waktu sendiri modul yang tidak dimuat `-c pass`."""
+    baseline = import_times_us(["-c", "pass"])
+    times = import_times_us(["main.py", *args])
+    return sum(us for name, us in times.items() if name not in baseline)
+
+def cli_time_ms_raw(argv, runs=STARTUP_RUNS):
+    """Mengembalikan median waktu (ms) satu pemanggilan interpreter dengan argumen tertentu."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *argv], cwd=HERE, env=ENV, capture_output=True, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+def cli_time_ms(args, runs=STARTUP_RUNS):
+    """Mengembalikan median waktu (ms) satu pemanggilan `main.py` dengan argumen tertentu."""
+    return cli_time_ms_raw(["main.py", *args], runs)
+
+def bench_startup():
+    """Mengukur startup CLI dan memeriksa anggaran import. Mengembalikan True jika lolos."""
+    print("--- Startup ---")
+    # Pemanasan: pastikan cache bytecode sudah ada sebelum diukur
+    cli_import_us(STARTUP_ARGS)
+    python_ms = cli_time_ms_raw(["-c", "pass"])
+    print(f"Interpreter kosong (-c pass)  : {python_ms:.1f} ms (median {STARTUP_RUNS}x)")
+    # Median dari beberapa pengukuran importtime untuk meredam noise
+    samples = sorted(cli_import_us(STARTUP_ARGS) for _ in range(5))
+    import_us = samples[len(samples) // 2]
+    print(f"Import CLI (semua modul)      : {import_us} us (anggaran {IMPORT_BUDGET_US} us)")
+    for label, args in [("encrypt ECB hex", STARTUP_ARGS),
+                        ("encrypt CBC teks", ["encrypt", "Hello", "A73B", "-m", "CBC"])]:
+        print(f"CLI {label:<26}: {cli_time_ms(args):.1f} ms (median {STARTUP_RUNS}x)")
+    ok = import_us <= IMPORT_BUDGET_US
+    print("Status startup: " + ("LOLOS" if ok else "GAGAL (import melebihi anggaran)"))
+    return ok
+
+# ---- Throughput File ----
+THROUGHPUT_BYTES = 2 * 1024 * 1024
+IO_LATENCY_S = 0.02 # Latensi buatan per operasi baca/tulis (meniru penyimpanan jaringan)
+
+class SlowStream:
+    """Pembungkus stream yang menambahkan latensi per operasi; sleep melepas GIL seperti I/O asli."""
+    def __init__(self, stream, latency):
+        self.stream = stream
+        self.latency = latency
+
+    def readinto(self, buf):
+        time.sleep(self.latency)
+        return self.stream.readinto(buf)
+
+    def read(self, size):
+        time.sleep(self.latency)
+        return self.stream.read(size)
+
+    def write(self, data):
+        time.sleep(self.latency)
+        return self.stream.write(data)
+
+def sequential_streams(fin, fout, transform, chunk_size):
+    """Acuan tanpa pipeline: setiap potongan dibaca, dienkripsi, lalu ditulis berurutan."""
+    from encrypt_decrypt import blocks_to_bytes, bytes_to_blocks
+    while True:
+        chunk = fin.read(chunk_size)
+        if not chunk:
+            break
+        blocks = bytes_to_blocks(chunk)
+        transform(blocks, len(blocks))
+        fout.write(blocks_to_bytes(blocks))
+
+def bench_throughput():
+    """Membandingkan throughput enkripsi CBC berurutan vs pipeline (informasi, tanpa anggaran)."""
+    import pipeline
+    from main import block_cipher
+    print("--- Throughput file (CBC encrypt) ---")
+    data = os.urandom(THROUGHPUT_BYTES)
+    cipher = block_cipher("A73B")
+    mb = len(data) / (1024 * 1024)
+    # Potongan lebih kecil saat latensi aktif agar ada cukup operasi I/O untuk ditumpangkan
+    for label, latency, chunk_size in [("lokal", 0, pipeline.CHUNK_SIZE),
+                                       (f"latensi {IO_LATENCY_S * 1000:.0f} ms/op", IO_LATENCY_S, 64 * 1024)]:
+        outputs = []
+        timings = []
+        for run in ("berurutan", "pipeline"):
+            fin = SlowStream(BytesIO(data), latency)
+            out = BytesIO()
+            fout = SlowStream(out, latency)
+            transform = pipeline.cbc_encrypt_transform(cipher, 0xFFFF)
+            start = time.perf_counter()
+            if run == "berurutan":
+                sequential_streams(fin, fout, transform, chunk_size)
+            else:
+                pipeline.FilePipeline(transform, chunk_size).run_streams(fin, fout)
+            timings.append(time.perf_counter() - start)
+            outputs.append(out.getvalue())
+        assert outputs[0] == outputs[1], "Output pipeline berbeda dari acuan berurutan"
+        seq, pipe = timings
+        print(f"{label:<20}: berurutan {mb / seq:6.2f} MB/s, pipeline {mb / pipe:6.2f} MB/s ({seq / pipe:.2f}x)")
+
+def main():
+    ok = bench_startup()
+    bench_throughput()
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
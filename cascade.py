@@ -0,0 +1,287 @@
+"""
+Mini-AES Bertingkat (Cascade) dan Serangan Meet-in-the-Middle
+Fitur:
+1. CascadeMiniAES: enkripsi berantai dengan beberapa kunci 16-bit (ganda, tripel, ...)
+2. meet_in_the_middle: mencari semua kombinasi kunci yang cocok dengan pasangan
+   plaintext/ciphertext yang diketahui
+
+Cara kerja serangan (kedalaman d, kunci k1..kd):
+- Index: untuk semua 2^16 kunci pertama k1, hitung nilai tengah E_k1(P_j) untuk beberapa
+  pasangan pertama, gabungkan menjadi satu integer, simpan di index hash di atas array
+  kunci terurut (ukuran tetap 2^16 entri, memori terbatas).
+- Scan: untuk semua kombinasi kunci sisanya (k2..kd) hitung D_k2(...D_kd(C_j)) dan cocokkan
+  ke index. Codebook satu kolom (satu nilai tengah untuk semua 2^16 kunci) dihitung
+  sekaligus dengan map, bukan satu per satu.
+- Verifikasi: setiap kecocokan langsung diuji dengan pasangan lain, sehingga hanya kandidat
+  valid yang disimpan (memori tidak tumbuh dengan jumlah kecocokan palsu).
+
+Biaya: cascade ganda 2^16 + 2^16 operasi (detik); cascade tripel 2^16 + 2^32 operasi
+(jam di Python murni, bisa dibagi ke beberapa proses dengan `workers`).
+"""
+
+import random
+import sys
+import time
+from array import array
+from itertools import repeat
+
+from encrypt_decrypt import MiniAESCorePurePython
+
+KEYSPACE = 1 << 16 # Jumlah kunci 16-bit
+DEFAULT_INDEX_PAIRS = 2 # Jumlah pasangan yang digabung menjadi nilai tengah di index (32-bit)
+MAX_INDEX_PAIRS = 4     # Nilai tengah gabungan disimpan di array('Q'): maksimal 64 // 16 pasangan
+
+# ---- Cipher Bertingkat ----
+class CascadeMiniAES:
+    """Mini-AES bertingkat: C = E_kn(...E_k2(E_k1(P))), semua tahap memakai core yang sama."""
+    def __init__(self, keys, core=None):
+        if len(keys) < 1:
+            raise ValueError("Cascade membutuhkan minimal satu kunci.")
+        self._core = core if core is not None else MiniAESCorePurePython()
+        self._keys = tuple(keys)
+        self._round_keys = [self._core.expand_key_int(k) for k in self._keys]
+
+    def __repr__(self):
+        """Representasi string dari kelas."""
+        keys = ", ".join(f"{k:04X}" for k in self._keys)
+        return f"Mini-AES Cascade ({len(self._keys)} kunci: {keys})"
+
+    def encrypt_int(self, block):
+        """Enkripsi satu blok 16-bit melalui semua tahap cascade."""
+        for rk in self._round_keys:
+            block = self._core.encrypt_int(block, rk)
+        return block
+
+    def decrypt_int(self, block):
+        """Dekripsi satu blok 16-bit (urutan tahap dibalik)."""
+        for rk in reversed(self._round_keys):
+            block = self._core.decrypt_int(block, rk)
+        return block
+
+# ---- Hasil Serangan ----
+class MITMResult:
+    """Hasil serangan meet-in-the-middle: kandidat kunci, jumlah kecocokan dan waktu per tahap."""
+    def __init__(self, depth, num_pairs, candidates, matches, timings):
+        self.depth = depth
+        self.num_pairs = num_pairs
+        self.candidates = candidates # List tuple kunci (k1, ..., kd) yang cocok dengan semua pasangan
+        self.matches = matches       # Jumlah kecocokan di index sebelum verifikasi pasangan lain
+        self.timings = timings       # Detik per tahap: key_schedule, index, scan, total
+
+    def report(self):
+        """Ringkasan hasil dalam bentuk teks."""
+        lines = [f"Cascade {self.depth} kunci, {self.num_pairs} pasangan diketahui",
+                 f"Kecocokan index        : {self.matches}",
+                 f"Kandidat kunci         : {len(self.candidates)}"]
+        for keys in self.candidates[:20]:
+            lines.append("   " + " ".join(f"{k:04X}" for k in keys))
+        if len(self.candidates) > 20:
+            lines.append(f"   ... ({len(self.candidates) - 20} lainnya)")
+        for name in ("key_schedule", "index", "scan", "total"):
+            lines.append(f"Waktu {name:<17}: {self.timings[name]:.3f} s")
+        return "\n".join(lines)
+
+# ---- Mesin Scan (dipakai di proses utama maupun worker) ----
+class _ScanState:
+    """Data read-only untuk tahap scan: index nilai tengah, kunci putaran dan pasangan."""
+    def __init__(self, core, pairs, depth, index_pairs, index, sorted_keys, sorted_values, round_keys):
+        self.core = core
+        self.pairs = pairs
+        self.depth = depth
+        self.index_pairs = index_pairs
+        self.index = index                 # nilai tengah gabungan -> posisi pertama di array terurut
+        self.sorted_keys = sorted_keys     # array('H') kunci k1 terurut menurut nilai tengah
+        self.sorted_values = sorted_values # array('Q') nilai tengah terurut
+        self.round_keys = round_keys       # kunci putaran untuk semua 2^16 kunci
+
+_worker_state = None
+
+def _init_worker(state):
+    """Initializer proses worker: simpan state scan sebagai global."""
+    global _worker_state
+    _worker_state = state
+
+def _combine(columns):
+    """Menggabungkan beberapa kolom nilai 16-bit menjadi satu integer per baris."""
+    combined = columns[0]
+    for j in range(1, len(columns)):
+        shift = 16 * j
+        combined = [c | (m << shift) for c, m in zip(combined, columns[j])]
+    return combined
+
+def _scan(state, xs, level, suffix, key_range):
+    """
+    Enumerasi kunci tahap `level` (dihitung dari kunci kedua) untuk nilai tengah xs.
+    Mengembalikan (jumlah kecocokan, kandidat terverifikasi).
+    """
+    decrypt, rks = state.core.decrypt_int, state.round_keys
+    if level > 1:
+        matches, found = 0, []
+        for k in key_range:
+            rk = rks[k]
+            m, f = _scan(state, [decrypt(x, rk) for x in xs], level - 1, (k,) + suffix, range(KEYSPACE))
+            matches += m
+            found.extend(f)
+        return matches, found
+
+    # Tahap terdalam: codebook satu kolom untuk seluruh rentang kunci sekaligus
+    start = key_range.start
+    sub = rks[key_range.start:key_range.stop]
+    combined = _combine([list(map(decrypt, repeat(x), sub)) for x in xs])
+    index, sorted_keys, sorted_values = state.index, state.sorted_keys, state.sorted_values
+    encrypt, extra = state.core.encrypt_int, state.pairs[state.index_pairs:]
+    matches, found = 0, []
+    for off in [i for i, c in enumerate(combined) if c in index]:
+        c = combined[off]
+        pos = index[c]
+        while pos < KEYSPACE and sorted_values[pos] == c:
+            keys = (sorted_keys[pos], start + off) + suffix
+            pos += 1
+            matches += 1
+            # Verifikasi langsung dengan pasangan yang tidak masuk index
+            for p, ct in extra:
+                for k in keys:
+                    p = encrypt(p, rks[k])
+                if p != ct:
+                    break
+            else:
+                found.append(keys)
+    return matches, found
+
+def _scan_range(key_range):
+    """Tugas worker: scan satu rentang kunci terluar (kunci terakhir cascade)."""
+    state = _worker_state
+    cts = [ct for _, ct in state.pairs[:state.index_pairs]]
+    if state.depth == 2:
+        return _scan(state, cts, 1, (), key_range)
+    decrypt, rks = state.core.decrypt_int, state.round_keys
+    matches, found = 0, []
+    for k in key_range:
+        m, f = _scan(state, [decrypt(c, rks[k]) for c in cts], state.depth - 2, (k,), range(KEYSPACE))
+        matches += m
+        found.extend(f)
+    return matches, found
+
+# ---- Serangan Meet-in-the-Middle ----
+def meet_in_the_middle(pairs, depth=2, core=None, index_pairs=DEFAULT_INDEX_PAIRS, workers=1, verbose=False):
+    """
+    Serangan meet-in-the-middle terhadap cascade Mini-AES dengan `depth` kunci.
+
+    pairs: list (plaintext, ciphertext) 16-bit (int) yang dienkripsi dengan cascade yang sama.
+    Mengembalikan MITMResult berisi semua tuple kunci yang cocok dengan seluruh pasangan.
+    """
+    if depth < 2:
+        raise ValueError("Meet-in-the-middle membutuhkan cascade minimal 2 kunci.")
+    if not pairs:
+        raise ValueError("Dibutuhkan minimal satu pasangan plaintext/ciphertext.")
+    if not 1 <= index_pairs <= MAX_INDEX_PAIRS:
+        raise ValueError(f"Jumlah pasangan index harus antara 1 dan {MAX_INDEX_PAIRS}.")
+    if workers < 1:
+        raise ValueError("Jumlah worker minimal 1.")
+    core = core if core is not None else MiniAESCorePurePython()
+    pairs = [(p, c) for p, c in pairs]
+    index_pairs = max(1, min(index_pairs, len(pairs)))
+    timings = {}
+    t_start = time.perf_counter()
+
+    # 1. Kunci putaran untuk seluruh ruang kunci (dipakai di kedua sisi)
+    round_keys = [core.expand_key_int(k) for k in range(KEYSPACE)]
+    timings["key_schedule"] = time.perf_counter() - t_start
+
+    # 2. Index nilai tengah setelah tahap pertama: E_k1(P_j) untuk semua k1
+    t = time.perf_counter()
+    combined = _combine([list(map(core.encrypt_int, repeat(p), round_keys)) for p, _ in pairs[:index_pairs]])
+    order = sorted(range(KEYSPACE), key=combined.__getitem__)
+    sorted_keys = array('H', order)
+    sorted_values = array('Q', (combined[k] for k in order))
+    index = {}
+    for pos, value in enumerate(sorted_values):
+        index.setdefault(value, pos)
+    timings["index"] = time.perf_counter() - t
+    if verbose:
+        print(f"Index nilai tengah: {len(index)} nilai unik dari {KEYSPACE} kunci ({timings['index']:.2f} s)")
+
+    # 3. Scan sisi dekripsi, dibagi per rentang kunci terluar
+    t = time.perf_counter()
+    state = _ScanState(core, pairs, depth, index_pairs, index, sorted_keys, sorted_values, round_keys)
+    # Cascade ganda: rentang besar (codebook per kolom); tripel ke atas: rentang kecil untuk progres/worker
+    step = -(-KEYSPACE // workers) if depth == 2 else 256
+    ranges = [range(s, min(s + step, KEYSPACE)) for s in range(0, KEYSPACE, step)]
+    matches, candidates = 0, []
+    if workers > 1:
+        import multiprocessing
+        with multiprocessing.Pool(min(workers, len(ranges)), initializer=_init_worker, initargs=(state,)) as pool:
+            results = pool.imap_unordered(_scan_range, ranges)
+            for done, (m, f) in enumerate(results, 1):
+                matches += m
+                candidates.extend(f)
+                if verbose and depth > 2:
+                    print(f"   Progres scan: {done}/{len(ranges)}", flush=True)
+    else:
+        _init_worker(state)
+        for done, key_range in enumerate(ranges, 1):
+            m, f = _scan_range(key_range)
+            matches += m
+            candidates.extend(f)
+            if verbose and depth > 2:
+                print(f"   Progres scan: {done}/{len(ranges)}", flush=True)
+    candidates.sort()
+    timings["scan"] = time.perf_counter() - t
+    timings["total"] = time.perf_counter() - t_start
+    return MITMResult(depth, len(pairs), candidates, matches, timings)
+
+# =================================
+# Blok eksekusi utama
+# =================================
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Serangan meet-in-the-middle terhadap cascade Mini-AES")
+    parser.add_argument('keys', nargs='*', help="Kunci rahasia cascade (hex 4-karakter) untuk membuat pasangan uji acak")
+    parser.add_argument('--pair', action='append', default=[], help="Pasangan diketahui PT:CT (hex 4-karakter), boleh berulang")
+    parser.add_argument('--depth', type=int, help="Jumlah kunci cascade (default: jumlah kunci, atau 2)")
+    parser.add_argument('--pairs', type=int, help="Jumlah pasangan acak yang dibuat dari kunci rahasia (default: kedalaman + 1)")
+    parser.add_argument('--index-pairs', type=int, default=DEFAULT_INDEX_PAIRS, help="Jumlah pasangan yang digabung di index (1-4, default: 2)")
+    parser.add_argument('--workers', type=int, default=1, help="Jumlah proses worker untuk tahap scan")
+    args = parser.parse_args()
+
+    try:
+        if not 1 <= args.index_pairs <= MAX_INDEX_PAIRS:
+            raise ValueError(f"--index-pairs harus antara 1 dan {MAX_INDEX_PAIRS}.")
+        if args.workers < 1:
+            raise ValueError("--workers minimal 1.")
+        core = MiniAESCorePurePython()
+        pairs = []
+        for item in args.pair:
+            pt_hex, _, ct_hex = item.partition(':')
+            if len(pt_hex) != 4 or len(ct_hex) != 4:
+                raise ValueError(f"Pasangan '{item}' harus berformat PT:CT dengan hex 4-karakter.")
+            # hex_to_int menolak tanda/prefiks seperti '-001' atau '0x12'
+            pairs.append((core.hex_to_int(pt_hex), core.hex_to_int(ct_hex)))
+        keys = []
+        for key_hex in args.keys:
+            if len(key_hex) != 4:
+                raise ValueError("Kunci harus berupa string hex 4-karakter (16-bit).")
+            keys.append(core.hex_to_int(key_hex))
+        depth = args.depth if args.depth is not None else (len(keys) or 2)
+        if depth < 2:
+            raise ValueError("--depth minimal 2 (meet-in-the-middle membutuhkan cascade minimal 2 kunci).")
+        if keys:
+            if len(keys) != depth:
+                raise ValueError("Jumlah kunci rahasia harus sama dengan --depth.")
+            # Buat pasangan plaintext/ciphertext acak dari kunci rahasia
+            cascade = CascadeMiniAES(keys, core)
+            print(f"{cascade}")
+            for pt in random.sample(range(KEYSPACE), args.pairs or depth + 1):
+                pairs.append((pt, cascade.encrypt_int(pt)))
+        if not pairs:
+            raise ValueError("Berikan kunci rahasia atau minimal satu --pair.")
+    except ValueError as e:
+        print(f"Error Validasi: {e}")
+        sys.exit(1)
+
+    print("Pasangan: " + ", ".join(f"{p:04X}:{c:04X}" for p, c in pairs))
+    result = meet_in_the_middle(pairs, depth, core, index_pairs=args.index_pairs, workers=args.workers, verbose=True)
+    print(result.report())
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
-import copy
+import sys
+from array import array
 
 # --- Aritmetika GF(2^4) (Modulo x^4 + x + 1) ---
 # Polinomial irreduksi x^4 + x + 1 direpresentasikan sebagai biner 10011
@@ -8,7 +9,7 @@ def gf_add(a, b):
   """Penjumlahan dalam GF(2^4) adalah operasi XOR."""
   return a ^ b
 
-def gf_multiply(a, b):
+def gf_multiply(a, b, poly=IRREDUCIBLE_POLY):
     """Perkalian dalam GF(2^4) menggunakan algoritma 'peasant's' dengan reduksi."""
     p = 0  # Inisialisasi hasil
     for _ in range(4): # Ulangi 4 kali untuk 4 bit
@@ -19,33 +20,119 @@ def gf_multiply(a, b):
         a <<= 1 # Geser kiri a (sama dengan mengalikan dengan x)
         if msb_set:
             # Jika MSB diset, kurangi dengan polinomial irreduksi (menggunakan XOR)
-            a ^= IRREDUCIBLE_POLY
+            a ^= poly
         # Pastikan a tetap dalam 4 bit (masking) agar tetap di GF(16)
         a &= 0b1111
         b >>= 1 # Geser kanan b
     return p
 
+def gf_inverse(a, poly=IRREDUCIBLE_POLY):
+    """Mencari invers perkalian dari a dalam GF(2^4) (pencarian atas 15 elemen tak nol)."""
+    if a == 0:
+        raise ValueError("Nol tidak memiliki invers perkalian dalam GF(2^4).")
+    for b in range(1, 16):
+        if gf_multiply(a, b, poly) == 1:
+            return b
+    # Hanya terjadi jika polinomial bukan irreduksi (ada pembagi nol)
+    raise ValueError(f"Polinomial {poly:#07b} tidak irreduksi: {a} tidak memiliki invers.")
+
+def invert_sbox(sbox):
+    """Menghitung Inverse S-Box dari S-Box 4-bit (harus permutasi dari 0..15)."""
+    if sorted(sbox) != list(range(16)):
+        raise ValueError("S-Box harus berupa permutasi dari 16 nibble (0..15).")
+    inverse = [0] * 16
+    for i, value in enumerate(sbox):
+        inverse[value] = i
+    return inverse
+
+def invert_matrix(m, poly=IRREDUCIBLE_POLY):
+    """Menghitung invers matriks 2x2 dalam GF(2^4)."""
+    # Di GF(2^n) pengurangan sama dengan penjumlahan, jadi det = m00*m11 + m01*m10
+    det = gf_add(gf_multiply(m[0][0], m[1][1], poly), gf_multiply(m[0][1], m[1][0], poly))
+    if det == 0:
+        raise ValueError("Matriks MixColumns tidak dapat diinvers (determinan = 0).")
+    d = gf_inverse(det, poly)
+    # Invers 2x2: (1/det) * [[m11, m01], [m10, m00]] (tanda minus hilang di GF(2^n))
+    return [[gf_multiply(d, m[1][1], poly), gf_multiply(d, m[0][1], poly)],
+            [gf_multiply(d, m[1][0], poly), gf_multiply(d, m[0][0], poly)]]
+
+# --- Representasi State Integer 16-bit ---
+# State [s00, s10, s01, s11] dikemas sebagai s00 s10 s01 s11 (nibble atas ke bawah),
+# sama dengan urutan karakter hex: "9C63" <-> [9, 12, 6, 3] <-> 0x9C63.
+def state_to_int(state):
+    """Mengemas list state [s00, s10, s01, s11] menjadi satu integer 16-bit."""
+    return (state[0] << 12) | (state[1] << 8) | (state[2] << 4) | state[3]
+
+def int_to_state(value):
+    """Membongkar integer 16-bit menjadi list state [s00, s10, s01, s11]."""
+    return [(value >> 12) & 0xF, (value >> 8) & 0xF, (value >> 4) & 0xF, value & 0xF]
+
+def bytes_to_blocks(data):
+    """Mengonversi bytes (panjang genap) menjadi array blok 16-bit (big-endian, urutan hex state)."""
+    blocks = array('H', data)
+    if sys.byteorder == 'little':
+        blocks.byteswap()
+    return blocks
+
+def blocks_to_bytes(blocks):
+    """Mengonversi array blok 16-bit kembali menjadi bytes big-endian."""
+    if sys.byteorder == 'little':
+        blocks = array('H', blocks)
+        blocks.byteswap()
+    return blocks.tobytes()
+
 # --- Kelas Inti MiniAES ---
 class MiniAESCorePurePython:
     """
     Mengimplementasikan inti Mini-AES 16-bit berdasarkan paper Phan (Cryptologia 2002).
     Termasuk jadwal kunci (key schedule) dan dekripsi dasar.
+
+    Tanpa argumen, kelas ini memakai parameter standar Phan. Varian riset dapat
+    dibuat dengan S-Box, matriks MixColumns, polinomial irreduksi dan jumlah
+    putaran sendiri; inversnya dihitung otomatis dan semuanya dikompilasi menjadi
+    tabel lookup terfusi sekali saat konstruksi (lihat `encrypt_int`/`decrypt_int`).
     """
-    def __init__(self):
+    def __init__(self, sbox=None, mc_matrix=None, poly=IRREDUCIBLE_POLY, rounds=2):
         self._key_size = 16 # Ukuran kunci dalam bit
+        self._is_standard = sbox is None and mc_matrix is None and poly == IRREDUCIBLE_POLY and rounds == 2
+        # Polinomial irreduksi harus berderajat 4 dan membentuk field (semua elemen tak nol punya invers)
+        if not (0b10000 <= poly <= 0b11111):
+            raise ValueError("Polinomial irreduksi harus berderajat 4 (antara 0b10000 dan 0b11111).")
+        if poly != IRREDUCIBLE_POLY:
+            for a in range(1, 16):
+                gf_inverse(a, poly)
+        self._poly = poly
+        if not isinstance(rounds, int) or rounds < 1:
+            raise ValueError("Jumlah putaran harus bilangan bulat >= 1.")
+        self._rounds = rounds
         # S-Box (Tabel 1 dalam paper Phan) - untuk substitusi
-        self._sboxE = [14, 4, 13, 1, 2, 15, 11, 8, 3, 10, 6, 12, 5, 9, 0, 7]
-        # Inverse S-Box (Tabel 3 dalam paper Phan) - untuk dekripsi
-        self._sboxD = [14, 3, 4, 8, 1, 12, 10, 15, 7, 13, 9, 6, 11, 2, 0, 5]
+        self._sboxE = list(sbox) if sbox is not None else [14, 4, 13, 1, 2, 15, 11, 8, 3, 10, 6, 12, 5, 9, 0, 7]
+        # Inverse S-Box (Tabel 3 dalam paper Phan) - untuk dekripsi, dihitung dari S-Box
+        self._sboxD = invert_sbox(self._sboxE)
         # Matriks MixColumns [[3, 2], [2, 3]] (dari Gambar 5)
-        self._mc_matrix = [[3, 2], [2, 3]]
+        self._mc_matrix = [list(row) for row in mc_matrix] if mc_matrix is not None else [[3, 2], [2, 3]]
+        if len(self._mc_matrix) != 2 or any(len(row) != 2 or not all(0 <= x <= 15 for x in row) for row in self._mc_matrix):
+            raise ValueError("Matriks MixColumns harus berukuran 2x2 dengan elemen nibble (0..15).")
+        # Matriks InvMixColumns (untuk [[3, 2], [2, 3]] hasilnya matriks itu sendiri)
+        self._inv_mc_matrix = invert_matrix(self._mc_matrix, poly)
         # Konstanta Putaran (Round Constants) (Bagian 3.6)
-        # RCON[0] tidak digunakan, RCON[1]=1 (0001), RCON[2]=2 (0010)
-        self._RCON = [0, 1, 2]
+        # RCON[0] tidak digunakan, RCON[1]=1 (0001), RCON[2]=2 (0010), RCON[i] = x * RCON[i-1]
+        self._RCON = [0, 1]
+        for _ in range(2, rounds + 1):
+            self._RCON.append(gf_multiply(self._RCON[-1], 2, poly))
+        # Tabel lookup untuk jalur cepat: parameter standar memakai konstanta yang
+        # sudah dihitung sebelumnya (mini_aes_tables.py), varian kustom dikompilasi di sini
+        if self._is_standard:
+            self._load_prebuilt_tables()
+        else:
+            self._compile_tables()
+        self._lane_tables = None # Tabel byte untuk codebook_int, dibuat saat pertama dipakai
 
     def __repr__(self):
         """Representasi string dari kelas."""
-        return "Mini-AES Core Pure Python (Spesifikasi Phan)"
+        if self._is_standard:
+            return "Mini-AES Core Pure Python (Spesifikasi Phan)"
+        return f"Mini-AES Core Pure Python (Varian kustom, {self._rounds} putaran)"
 
     # --- Fungsi Bantuan Representasi Data ---
     def hex_to_state(self, hex_string):
@@ -68,6 +155,57 @@ class MiniAESCorePurePython:
         # Format setiap nibble sebagai karakter hex tunggal dan gabungkan
         return "".join(f'{nibble:X}' for nibble in state)
 
+    # --- API State Integer 16-bit ---
+    # Satu int menggantikan list 4 nibble: XOR, geser dan lookup bekerja langsung pada int.
+    # Method berbasis list di atas/bawah tetap ada untuk kompatibilitas dan jejak putaran.
+    def hex_to_int(self, hex_string):
+        """Mengonversi 4 karakter hex ke state integer 16-bit."""
+        if len(hex_string) != 4:
+            raise ValueError("String hex input harus terdiri dari 4 karakter.")
+        if not all(c in '0123456789ABCDEFabcdef' for c in hex_string):
+            raise ValueError("Ditemukan karakter heksadesimal yang tidak valid.")
+        return int(hex_string, 16)
+
+    def int_to_hex(self, value):
+        """Mengonversi state integer 16-bit ke string hex 4 karakter."""
+        return f"{value:04X}"
+
+    def state_to_int(self, state):
+        """Adapter: list state [s00, s10, s01, s11] -> state integer 16-bit."""
+        return state_to_int(state)
+
+    def int_to_state(self, value):
+        """Adapter: state integer 16-bit -> list state [s00, s10, s01, s11]."""
+        return int_to_state(value)
+
+    def sub_nibbles_int(self, state):
+        """SubNibbles pada state integer (dua lookup per byte)."""
+        return (self._sub_byte[state >> 8] << 8) | self._sub_byte[state & 0xFF]
+
+    def shift_rows_int(self, state):
+        """ShiftRows pada state integer: tukar nibble s10 (bit 8-11) dan s11 (bit 0-3)."""
+        return (state & 0xF0F0) | ((state >> 8) & 0x000F) | ((state & 0x000F) << 8)
+
+    def mix_columns_int(self, state):
+        """MixColumns pada state integer (satu lookup per kolom)."""
+        return (self._mix_byte[state >> 8] << 8) | self._mix_byte[state & 0xFF]
+
+    def add_round_key_int(self, state, round_key):
+        """AddRoundKey pada state integer (satu XOR)."""
+        return state ^ round_key
+
+    def inv_sub_nibbles_int(self, state):
+        """InvSubNibbles pada state integer."""
+        return (self._inv_sub_byte[state >> 8] << 8) | self._inv_sub_byte[state & 0xFF]
+
+    def inv_shift_rows_int(self, state):
+        """InvShiftRows pada state integer (sama dengan ShiftRows untuk matriks 2x2)."""
+        return self.shift_rows_int(state)
+
+    def inv_mix_columns_int(self, state):
+        """InvMixColumns pada state integer."""
+        return (self._inv_mix_byte[state >> 8] << 8) | self._inv_mix_byte[state & 0xFF]
+
     # --- Operasi Inti AES ---
     def sub_nibbles(self, state):
         """Melakukan operasi SubNibbles menggunakan S-Box."""
@@ -84,25 +222,29 @@ class MiniAESCorePurePython:
         s00, s10, s01, s11 = state
         return [s00, s11, s01, s10] # State baru setelah pertukaran
 
-    def mix_columns(self, state):
-        """Melakukan operasi MixColumns menggunakan matriks konstan dan matematika GF(2^4)."""
+    def _multiply_columns(self, state, m):
+        """Mengalikan setiap kolom state dengan matriks 2x2 m dalam GF(2^4)."""
         # State: [s00, s10, s01, s11]
-        # Matriks: [[m00, m01], [m10, m11]] = [[3, 2], [2, 3]]
+        # Matriks: [[m00, m01], [m10, m11]]
         s00, s10, s01, s11 = state
-        m = self._mc_matrix
+        p = self._poly
         # Kolom 0 baru:
         # d00 = (m00 * s00) + (m01 * s10)  <- perkalian & penjumlahan di GF(2^4)
         # d10 = (m10 * s00) + (m11 * s10)
-        d00 = gf_add(gf_multiply(m[0][0], s00), gf_multiply(m[0][1], s10))
-        d10 = gf_add(gf_multiply(m[1][0], s00), gf_multiply(m[1][1], s10))
+        d00 = gf_add(gf_multiply(m[0][0], s00, p), gf_multiply(m[0][1], s10, p))
+        d10 = gf_add(gf_multiply(m[1][0], s00, p), gf_multiply(m[1][1], s10, p))
         # Kolom 1 baru:
         # d01 = (m00 * s01) + (m01 * s11)
         # d11 = (m10 * s01) + (m11 * s11)
-        d01 = gf_add(gf_multiply(m[0][0], s01), gf_multiply(m[0][1], s11))
-        d11 = gf_add(gf_multiply(m[1][0], s01), gf_multiply(m[1][1], s11))
+        d01 = gf_add(gf_multiply(m[0][0], s01, p), gf_multiply(m[0][1], s11, p))
+        d11 = gf_add(gf_multiply(m[1][0], s01, p), gf_multiply(m[1][1], s11, p))
         # Kembalikan state baru [d00, d10, d01, d11]
         return [d00, d10, d01, d11]
 
+    def mix_columns(self, state):
+        """Melakukan operasi MixColumns menggunakan matriks konstan dan matematika GF(2^4)."""
+        return self._multiply_columns(state, self._mc_matrix)
+
     def add_round_key(self, state, round_key):
         """Melakukan operasi AddRoundKey (XOR per elemen)."""
         # XOR setiap nibble state dengan nibble round key yang bersesuaian
@@ -110,75 +252,50 @@ class MiniAESCorePurePython:
 
     # --- Ekspansi Kunci (Key Expansion) (Tabel 2 dalam paper Phan) ---
     def expand_key(self, key_state):
-        """Menghasilkan kunci putaran K0, K1, K2 dari kunci utama."""
-        # Inisialisasi list untuk menyimpan K0, K1, K2
-        round_keys = [[0]*4 for _ in range(3)]
-        # Array untuk menyimpan 'word' w0 hingga w11 (setiap word 1 nibble di Mini-AES)
-        w = [0] * 12
-
+        """Menghasilkan kunci putaran K0, K1, ..., Kr dari kunci utama (K0..K2 untuk Mini-AES standar)."""
+        # Array 'word' w0, w1, ... (setiap word 1 nibble di Mini-AES)
         # K0 adalah kunci utama itu sendiri (w0, w1, w2, w3)
-        round_keys[0] = list(key_state) # Salin K0
-        w[0], w[1], w[2], w[3] = key_state[0], key_state[1], key_state[2], key_state[3]
-
-        # Hitung word untuk K1 (w4, w5, w6, w7)
-        temp_sub_w3 = self._sboxE[w[3]] # Lakukan NibbleSub(w3)
-        # w4 = w0 XOR Sub(w3) XOR RCON[1]
-        w[4] = gf_add(gf_add(w[0], temp_sub_w3), self._RCON[1])
-        # w5 = w1 XOR w4
-        w[5] = gf_add(w[1], w[4])
-        # w6 = w2 XOR w5
-        w[6] = gf_add(w[2], w[5])
-        # w7 = w3 XOR w6
-        w[7] = gf_add(w[3], w[6])
-        round_keys[1] = [w[4], w[5], w[6], w[7]] # Simpan K1
-
-        # Hitung word untuk K2 (w8, w9, w10, w11)
-        temp_sub_w7 = self._sboxE[w[7]] # Lakukan NibbleSub(w7)
-        # w8 = w4 XOR Sub(w7) XOR RCON[2]
-        w[8] = gf_add(gf_add(w[4], temp_sub_w7), self._RCON[2])
-        # w9 = w5 XOR w8
-        w[9] = gf_add(w[5], w[8])
-        # w10 = w6 XOR w9
-        w[10] = gf_add(w[6], w[9])
-        # w11 = w7 XOR w10
-        w[11] = gf_add(w[7], w[10])
-        round_keys[2] = [w[8], w[9], w[10], w[11]] # Simpan K2
-
-        return round_keys # Kembalikan list berisi [K0, K1, K2]
+        w = list(key_state)
+
+        # Hitung word untuk K1, K2, ... (4 word per kunci putaran)
+        for i in range(1, self._rounds + 1):
+            base = 4 * i
+            # w[4i] = w[4i-4] XOR NibbleSub(w[4i-1]) XOR RCON[i]
+            w.append(gf_add(gf_add(w[base - 4], self._sboxE[w[base - 1]]), self._RCON[i]))
+            # w[4i+j] = w[4i-4+j] XOR w[4i+j-1] untuk j = 1, 2, 3
+            for j in range(1, 4):
+                w.append(gf_add(w[base - 4 + j], w[base + j - 1]))
+
+        # Kembalikan list berisi [K0, K1, ..., Kr]
+        return [w[4 * i:4 * i + 4] for i in range(self._rounds + 1)]
 
     # --- Proses Enkripsi Utama ---
     def encrypt(self, plaintext_state, key_state, verbose=True):
         """Melakukan enkripsi Mini-AES."""
-        # Dapatkan kunci putaran K0, K1, K2
-        K0, K1, K2 = self.expand_key(key_state)
+        # Dapatkan kunci putaran K0, K1, ..., Kr
+        round_keys = self.expand_key(key_state)
+        last = self._rounds
         if verbose:
             print(f"Kunci yang Dihitung:")
-            print(f"  K0: {self.state_to_hex(K0)} -> {K0}")
-            print(f"  K1: {self.state_to_hex(K1)} -> {K1}")
-            print(f"  K2: {self.state_to_hex(K2)} -> {K2}\n")
+            for i, K in enumerate(round_keys):
+                print(f"  K{i}: {self.state_to_hex(K)} -> {K}")
+            print()
 
         # AddRoundKey Awal (dengan K0)
-        state = self.add_round_key(plaintext_state, K0)
+        state = self.add_round_key(plaintext_state, round_keys[0])
         if verbose: print(f"Mulai    (AddK0): {self.state_to_hex(state)} -> {state}")
 
-        # Putaran 1
-        state = self.sub_nibbles(state)
-        if verbose: print(f"Putaran 1 SubNib: {self.state_to_hex(state)} -> {state}")
-        state = self.shift_rows(state)
-        if verbose: print(f"Putaran 1 ShiftR: {self.state_to_hex(state)} -> {state}")
-        state = self.mix_columns(state)
-        if verbose: print(f"Putaran 1 MixCol: {self.state_to_hex(state)} -> {state}")
-        state = self.add_round_key(state, K1) # AddRoundKey dengan K1
-        if verbose: print(f"Putaran 1 AddK1:  {self.state_to_hex(state)} -> {state}")
-
-        # Putaran 2 (Final)
-        state = self.sub_nibbles(state)
-        if verbose: print(f"Putaran 2 SubNib: {self.state_to_hex(state)} -> {state}")
-        state = self.shift_rows(state)
-        if verbose: print(f"Putaran 2 ShiftR: {self.state_to_hex(state)} -> {state}")
-        # Tidak ada MixColumns pada putaran terakhir
-        state = self.add_round_key(state, K2) # AddRoundKey dengan K2
-        if verbose: print(f"Putaran 2 AddK2:  {self.state_to_hex(state)} -> {state}")
+        for r in range(1, last + 1):
+            state = self.sub_nibbles(state)
+            if verbose: print(f"Putaran {r} SubNib: {self.state_to_hex(state)} -> {state}")
+            state = self.shift_rows(state)
+            if verbose: print(f"Putaran {r} ShiftR: {self.state_to_hex(state)} -> {state}")
+            # Tidak ada MixColumns pada putaran terakhir
+            if r < last:
+                state = self.mix_columns(state)
+                if verbose: print(f"Putaran {r} MixCol: {self.state_to_hex(state)} -> {state}")
+            state = self.add_round_key(state, round_keys[r]) # AddRoundKey dengan Kr
+            if verbose: print(f"Putaran {r} AddK{r}:  {self.state_to_hex(state)} -> {state}")
 
         return state # Kembalikan state ciphertext
 
@@ -195,47 +312,173 @@ class MiniAESCorePurePython:
 
     def inv_mix_columns(self, state):
         """Melakukan operasi MixColumns invers."""
-        # Untuk matriks spesifik [[3, 2], [2, 3]], matriks ini adalah inversnya sendiri
-        # dalam GF(2^4). Jika matriks berbeda digunakan, inversnya diperlukan di sini.
-        return self.mix_columns(state)
+        # Memakai matriks invers yang dihitung di konstruktor. Untuk matriks standar
+        # [[3, 2], [2, 3]] inversnya adalah matriks itu sendiri dalam GF(2^4).
+        return self._multiply_columns(state, self._inv_mc_matrix)
 
     # --- Proses Dekripsi Utama ---
     def decrypt(self, ciphertext_state, key_state, verbose=True):
         """Melakukan dekripsi Mini-AES."""
-        # Dapatkan kunci putaran K0, K1, K2
-        K0, K1, K2 = self.expand_key(key_state)
+        # Dapatkan kunci putaran K0, K1, ..., Kr
+        round_keys = self.expand_key(key_state)
+        last = self._rounds
         if verbose:
             print(f"Menggunakan Kunci untuk Dekripsi:")
-            print(f"  K0: {self.state_to_hex(K0)}")
-            print(f"  K1: {self.state_to_hex(K1)}")
-            print(f"  K2: {self.state_to_hex(K2)}\n")
+            for i, K in enumerate(round_keys):
+                print(f"  K{i}: {self.state_to_hex(K)}")
+            print()
 
-        # Mulai dengan membatalkan AddRoundKey terakhir (K2)
-        state = self.add_round_key(ciphertext_state, K2)
-        if verbose: print(f"Mulai Dek (AddK2): {self.state_to_hex(state)}")
+        # Mulai dengan membatalkan AddRoundKey terakhir (Kr)
+        state = self.add_round_key(ciphertext_state, round_keys[last])
+        if verbose: print(f"Mulai Dek (AddK{last}): {self.state_to_hex(state)}")
 
-        # Putaran 2 Invers (Putaran Final Invers)
+        # Putaran Final Invers (tanpa MixColumns)
         state = self.inv_shift_rows(state) # Batalkan ShiftRows
-        if verbose: print(f"Inv Ptr 2 ShiftR: {self.state_to_hex(state)}")
+        if verbose: print(f"Inv Ptr {last} ShiftR: {self.state_to_hex(state)}")
         state = self.inv_sub_nibbles(state) # Batalkan SubNibbles
-        if verbose: print(f"Inv Ptr 2 SubNib: {self.state_to_hex(state)}")
-
-        # Putaran 1 Invers
-        state = self.add_round_key(state, K1) # Batalkan AddRoundKey K1
-        if verbose: print(f"Inv Ptr 1 AddK1:  {self.state_to_hex(state)}")
-        state = self.inv_mix_columns(state)   # Batalkan MixColumns
-        if verbose: print(f"Inv Ptr 1 MixCol: {self.state_to_hex(state)}")
-        state = self.inv_shift_rows(state)    # Batalkan ShiftRows
-        if verbose: print(f"Inv Ptr 1 ShiftR: {self.state_to_hex(state)}")
-        state = self.inv_sub_nibbles(state)   # Batalkan SubNibbles
-        if verbose: print(f"Inv Ptr 1 SubNib: {self.state_to_hex(state)}")
+        if verbose: print(f"Inv Ptr {last} SubNib: {self.state_to_hex(state)}")
+
+        # Putaran r-1 .. 1 Invers
+        for r in range(last - 1, 0, -1):
+            state = self.add_round_key(state, round_keys[r]) # Batalkan AddRoundKey Kr
+            if verbose: print(f"Inv Ptr {r} AddK{r}:  {self.state_to_hex(state)}")
+            state = self.inv_mix_columns(state)   # Batalkan MixColumns
+            if verbose: print(f"Inv Ptr {r} MixCol: {self.state_to_hex(state)}")
+            state = self.inv_shift_rows(state)    # Batalkan ShiftRows
+            if verbose: print(f"Inv Ptr {r} ShiftR: {self.state_to_hex(state)}")
+            state = self.inv_sub_nibbles(state)   # Batalkan SubNibbles
+            if verbose: print(f"Inv Ptr {r} SubNib: {self.state_to_hex(state)}")
 
         # AddRoundKey K0 Final (Membatalkan AddRoundKey Awal)
-        state = self.add_round_key(state, K0)
+        state = self.add_round_key(state, round_keys[0])
         if verbose: print(f"Final Dek (AddK0): {self.state_to_hex(state)}")
 
         return state # Kembalikan state plaintext
 
+    # --- Jalur Cepat: Tabel Lookup Terfusi (state integer 16-bit) ---
+    def _compile_tables(self):
+        """Mengompilasi operasi putaran menjadi tabel lookup per kolom (byte) sekali saja."""
+        # State integer: s00 s10 | s01 s11 -> byte atas = kolom 0, byte bawah = kolom 1.
+        # Setiap putaran = XOR dua lookup (satu per byte). Nilai 0 di posisi lain
+        # hanyalah pengisi karena operasi yang tersisa setelah S-Box bersifat linear.
+        sE, sD = self._sboxE, self._sboxD
+        sub, inv_sub, mix, inv_mix = [], [], [], []
+        enc_hi, enc_lo, fin_hi, fin_lo = [], [], [], []
+        dec_hi, dec_lo, dfin_hi, dfin_lo = [], [], [], []
+        for b in range(256):
+            h, l = b >> 4, b & 0xF
+            # Operasi tunggal per byte (kolom) untuk API state integer
+            sub.append((sE[h] << 4) | sE[l])
+            inv_sub.append((sD[h] << 4) | sD[l])
+            mix.append(state_to_int(self.mix_columns([h, l, 0, 0])) >> 8)
+            inv_mix.append(state_to_int(self.inv_mix_columns([h, l, 0, 0])) >> 8)
+            # Enkripsi putaran penuh: SubNibbles -> ShiftRows -> MixColumns
+            sub_hi, sub_lo = [sE[h], sE[l], 0, 0], [0, 0, sE[h], sE[l]]
+            enc_hi.append(state_to_int(self.mix_columns(self.shift_rows(sub_hi))))
+            enc_lo.append(state_to_int(self.mix_columns(self.shift_rows(sub_lo))))
+            # Enkripsi putaran terakhir: SubNibbles -> ShiftRows
+            fin_hi.append(state_to_int(self.shift_rows(sub_hi)))
+            fin_lo.append(state_to_int(self.shift_rows(sub_lo)))
+            # Dekripsi putaran terakhir invers: InvShiftRows -> InvSubNibbles
+            dfin_hi.append(state_to_int(self.inv_shift_rows([sD[h], sD[l], 0, 0])))
+            dfin_lo.append(state_to_int(self.inv_shift_rows([0, 0, sD[h], sD[l]])))
+            # Dekripsi putaran penuh invers: InvMixColumns -> InvShiftRows -> InvSubNibbles
+            # (InvMixColumns per kolom, InvSubNibbles hanya pada nibble milik kolom ini)
+            y = self.inv_mix_columns([h, l, 0, 0])
+            dec_hi.append(state_to_int(self.inv_shift_rows([sD[y[0]], sD[y[1]], 0, 0])))
+            y = self.inv_mix_columns([0, 0, h, l])
+            dec_lo.append(state_to_int(self.inv_shift_rows([0, 0, sD[y[2]], sD[y[3]]])))
+        self._sub_byte, self._inv_sub_byte = tuple(sub), tuple(inv_sub)
+        self._mix_byte, self._inv_mix_byte = tuple(mix), tuple(inv_mix)
+        self._enc_hi, self._enc_lo = tuple(enc_hi), tuple(enc_lo)
+        self._fin_hi, self._fin_lo = tuple(fin_hi), tuple(fin_lo)
+        self._dec_hi, self._dec_lo = tuple(dec_hi), tuple(dec_lo)
+        self._dfin_hi, self._dfin_lo = tuple(dfin_hi), tuple(dfin_lo)
+
+    def _load_prebuilt_tables(self):
+        """Memuat tabel terfusi parameter standar dari konstanta modul mini_aes_tables."""
+        import mini_aes_tables as t
+        self._sub_byte, self._inv_sub_byte = t.SUB_BYTE, t.INV_SUB_BYTE
+        self._mix_byte, self._inv_mix_byte = t.MIX_BYTE, t.INV_MIX_BYTE
+        self._enc_hi, self._enc_lo = t.ENC_HI, t.ENC_LO
+        self._fin_hi, self._fin_lo = t.FIN_HI, t.FIN_LO
+        self._dec_hi, self._dec_lo = t.DEC_HI, t.DEC_LO
+        self._dfin_hi, self._dfin_lo = t.DFIN_HI, t.DFIN_LO
+
+    def expand_key_int(self, key):
+        """Ekspansi kunci 16-bit (int) menjadi tuple kunci putaran (int) untuk jalur cepat."""
+        # Sama dengan expand_key, tetapi word disimpan di variabel lokal (tanpa list)
+        sE, rcon = self._sboxE, self._RCON
+        w0, w1, w2, w3 = (key >> 12) & 0xF, (key >> 8) & 0xF, (key >> 4) & 0xF, key & 0xF
+        round_keys = [key]
+        for i in range(1, self._rounds + 1):
+            w0 ^= sE[w3] ^ rcon[i]
+            w1 ^= w0
+            w2 ^= w1
+            w3 ^= w2
+            round_keys.append((w0 << 12) | (w1 << 8) | (w2 << 4) | w3)
+        return tuple(round_keys)
+
+    def encrypt_int(self, block, round_keys):
+        """Enkripsi satu blok 16-bit (int) memakai tabel terfusi, tanpa jejak putaran."""
+        enc_hi, enc_lo = self._enc_hi, self._enc_lo
+        s = block ^ round_keys[0]
+        for k in round_keys[1:-1]:
+            s = enc_hi[s >> 8] ^ enc_lo[s & 0xFF] ^ k
+        return self._fin_hi[s >> 8] ^ self._fin_lo[s & 0xFF] ^ round_keys[-1]
+
+    def decrypt_int(self, block, round_keys):
+        """Dekripsi satu blok 16-bit (int) memakai tabel terfusi, tanpa jejak putaran."""
+        dec_hi, dec_lo = self._dec_hi, self._dec_lo
+        s = block ^ round_keys[-1]
+        s = self._dfin_hi[s >> 8] ^ self._dfin_lo[s & 0xFF]
+        for k in round_keys[-2:0:-1]:
+            s ^= k
+            s = dec_hi[s >> 8] ^ dec_lo[s & 0xFF]
+        return s ^ round_keys[0]
+
+    # --- Codebook Penuh: semua 2^16 blok sekaligus per lajur byte ---
+    def _build_lane_tables(self):
+        """Memecah tabel terfusi 16-bit menjadi tabel translasi byte (untuk bytes.translate)."""
+        def split(table):
+            return bytes(v >> 8 for v in table), bytes(v & 0xFF for v in table)
+        self._lane_tables = (split(self._enc_hi), split(self._enc_lo),
+                             split(self._fin_hi), split(self._fin_lo),
+                             [bytes(i ^ k for i in range(256)) for k in range(256)])
+        return self._lane_tables
+
+    def codebook_int(self, round_keys):
+        """
+        Codebook enkripsi lengkap satu kunci: array('H') C dengan C[p] = E_K(p) untuk semua p.
+
+        State seluruh 2^16 blok disimpan sebagai dua lajur byte (byte atas, byte bawah).
+        Setiap putaran = bytes.translate per lajur + XOR integer besar antar lajur, dengan
+        kunci putaran dilipat ke tabel translasi, sehingga tidak ada loop Python per blok.
+        """
+        enc_hi, enc_lo, fin_hi, fin_lo, xor = self._lane_tables or self._build_lane_tables()
+        k = round_keys[0]
+        hi = _IDENTITY_HI.translate(xor[k >> 8])
+        lo = _IDENTITY_LO.translate(xor[k & 0xFF])
+        last = len(round_keys) - 1
+        for r in range(1, last + 1):
+            (hh, hl), (lh, ll) = (enc_hi, enc_lo) if r < last else (fin_hi, fin_lo)
+            k = round_keys[r]
+            # byte atas baru = T_hi[byte atas].atas ^ T_lo[byte bawah].atas ^ kunci.atas (sama untuk bawah)
+            hi, lo = (_xor_lanes(hi.translate(hh.translate(xor[k >> 8])), lo.translate(lh)),
+                      _xor_lanes(hi.translate(hl.translate(xor[k & 0xFF])), lo.translate(ll)))
+        data = bytearray(2 * len(hi))
+        data[0::2] = hi
+        data[1::2] = lo
+        return bytes_to_blocks(data)
+
+# Lajur byte untuk blok 0..FFFF berurutan: byte atas = p >> 8, byte bawah = p & 0xFF
+_IDENTITY_HI = b"".join(bytes([i]) * 256 for i in range(256))
+_IDENTITY_LO = bytes(range(256)) * 256
+
+def _xor_lanes(a, b):
+    """XOR dua lajur byte sepanjang sama sekaligus (lewat integer besar)."""
+    return (int.from_bytes(a, 'little') ^ int.from_bytes(b, 'little')).to_bytes(len(a), 'little')
+
 # =================================
 # Blok eksekusi utama untuk pengujian
 # =================================
@@ -0,0 +1,178 @@
+"""
+Enkripsi Ulang Inkremental Mini-AES (mode ECB)
+Fitur:
+1. Sidecar hash blok: satu digest per potongan plaintext, disimpan di `<ciphertext>.blkhash`
+2. Deteksi potongan yang berubah dengan membandingkan hash (dari sidecar atau plaintext lama)
+3. Hanya rentang ciphertext yang berubah yang dienkripsi dan ditulis ulang di tempat
+
+Hanya berlaku untuk mode ECB: setiap blok ciphertext bergantung pada blok plaintext di
+offset yang sama saja. Pada CBC/AUTH perubahan satu blok merambat ke semua blok setelahnya.
+
+Biaya: plaintext baru tetap dibaca sekali untuk di-hash (hashlib, cepat), tetapi enkripsi
+dan penulisan ke ciphertext maupun sidecar sebanding dengan ukuran perubahan.
+"""
+
+import hashlib
+import os
+import struct
+
+from encrypt_decrypt import blocks_to_bytes, bytes_to_blocks
+
+# ---- Konstanta ----
+DEFAULT_CHUNK_SIZE = 4096  # Granularitas deteksi perubahan (byte, harus genap)
+DIGEST_SIZE = 16           # Ukuran digest BLAKE2b per potongan (byte)
+BATCH_CHUNKS = 256         # Jumlah potongan yang diproses per batch baca/tulis sidecar
+KEY_CHECK_BYTES = 16       # Awal plaintext lama yang dicocokkan ke ciphertext saat tanpa sidecar
+SIDECAR_SUFFIX = ".blkhash"
+SIDECAR_MAGIC = b"MAESBH1\x00"
+# Header sidecar: magic, ukuran potongan, panjang plaintext, key check value E_K(0000)
+_HEADER = struct.Struct("<8sIQH")
+
+def default_sidecar_path(cipher_file):
+    """Lokasi sidecar default untuk sebuah file ciphertext."""
+    return cipher_file + SIDECAR_SUFFIX
+
+def _digest(data):
+    """Hash satu potongan plaintext."""
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()
+
+def _padded(length):
+    """Panjang ciphertext ECB untuk plaintext `length` byte (padding nol ke kelipatan 2 byte)."""
+    return length + (length % 2)
+
+def _read_header(sidecar):
+    """Membaca dan memvalidasi header sidecar. Mengembalikan (chunk_size, plain_len, kcv)."""
+    raw = sidecar.read(_HEADER.size)
+    if len(raw) != _HEADER.size:
+        raise ValueError("File sidecar terlalu pendek.")
+    magic, chunk_size, plain_len, kcv = _HEADER.unpack(raw)
+    if magic != SIDECAR_MAGIC:
+        raise ValueError("File sidecar tidak dikenali (magic salah).")
+    return chunk_size, plain_len, kcv
+
+def _check_key_old_plain(core, rk, kcv, old_plain, cipher_file, sidecar_file):
+    """
+    Memastikan kunci cocok dengan ciphertext yang ada sebelum apa pun ditulis (jalur --old-plain).
+
+    Jika sidecar ada, key check value-nya dibandingkan; jika tidak, E_K(blok pertama plaintext
+    lama) harus sama dengan blok pertama ciphertext (beberapa blok pertama, agar peluang
+    kunci salah lolos bukan 1/2^16).
+    """
+    if sidecar_file is not None:
+        with open(sidecar_file, 'rb') as sc:
+            _, _, sc_kcv = _read_header(sc)
+        if sc_kcv != kcv:
+            raise ValueError("Kunci tidak cocok dengan sidecar (ciphertext dibuat dengan kunci lain).")
+        return
+    first = old_plain.read(KEY_CHECK_BYTES)
+    old_plain.seek(0)
+    if not first:
+        return # Ciphertext kosong: tidak ada yang bisa (atau perlu) dicocokkan
+    with open(cipher_file, 'rb') as fc:
+        expected = fc.read(_padded(len(first)))
+    if _encrypt_chunk(core, first, rk) != expected:
+        raise ValueError("Kunci tidak cocok dengan ciphertext yang ada (awal plaintext lama tidak terenkripsi ke awal ciphertext).")
+
+def _encrypt_chunk(core, data, rk):
+    """Enkripsi ECB satu potongan plaintext memakai jalur cepat."""
+    if len(data) % 2:
+        data += b'\x00' # Padding nol, sama seperti mode ECB biasa
+    blocks = bytes_to_blocks(data)
+    encrypt = core.encrypt_int
+    for j, p in enumerate(blocks):
+        blocks[j] = encrypt(p, rk)
+    return blocks_to_bytes(blocks)
+
+def reencrypt_ecb(core, plain_file, cipher_file, key, old_plain_file=None, sidecar_file=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Memperbarui ciphertext ECB `cipher_file` agar sesuai dengan `plain_file`.
+
+    Potongan lama diketahui dari `old_plain_file` (jika diberikan) atau dari sidecar. Tanpa
+    keduanya (atau jika ciphertext belum ada) seluruh file dienkripsi. Sidecar selalu
+    diperbarui. Mengembalikan (list rentang byte (awal, akhir) yang ditulis ulang, jumlah potongan).
+    """
+    if chunk_size <= 0 or chunk_size % 2:
+        raise ValueError("Ukuran potongan harus bilangan genap positif.")
+    rk = core.expand_key_int(key)
+    kcv = core.encrypt_int(0, rk)
+    sidecar_file = sidecar_file or default_sidecar_path(cipher_file)
+    new_len = os.path.getsize(plain_file)
+
+    # --- Tentukan sumber hash lama ---
+    old_plain = None
+    old_len = 0
+    have_cipher = os.path.exists(cipher_file)
+    have_sidecar = os.path.exists(sidecar_file)
+    if have_cipher and old_plain_file is not None:
+        old_plain = open(old_plain_file, 'rb')
+        old_len = os.path.getsize(old_plain_file)
+    elif have_cipher and have_sidecar:
+        with open(sidecar_file, 'rb') as sc:
+            sc_chunk, old_len, sc_kcv = _read_header(sc)
+        if sc_kcv != kcv:
+            raise ValueError("Kunci tidak cocok dengan sidecar (ciphertext dibuat dengan kunci lain).")
+        if sc_chunk != chunk_size:
+            # Ikuti granularitas sidecar yang sudah ada
+            chunk_size = sc_chunk
+    else:
+        have_cipher = False # Tidak ada acuan: enkripsi penuh
+    try:
+        if have_cipher and os.path.getsize(cipher_file) != _padded(old_len):
+            raise ValueError("Ukuran ciphertext tidak sesuai dengan plaintext lama/sidecar.")
+        if old_plain is not None:
+            _check_key_old_plain(core, rk, kcv, old_plain, cipher_file, sidecar_file if have_sidecar else None)
+    except Exception:
+        if old_plain is not None:
+            old_plain.close()
+        raise
+    old_chunks = -(-old_len // chunk_size) if have_cipher else 0
+    new_chunks = -(-new_len // chunk_size)
+
+    # Sidecar baru ditulis penuh jika belum valid; jika valid hanya record yang berubah
+    rewrite_sidecar = not (have_cipher and have_sidecar and old_plain is None)
+    ranges = []
+    try:
+        with open(plain_file, 'rb') as fin, \
+             open(cipher_file, 'r+b' if have_cipher else 'wb') as fout, \
+             open(sidecar_file, 'wb' if rewrite_sidecar else 'r+b') as sc:
+            sc.write(_HEADER.pack(SIDECAR_MAGIC, chunk_size, new_len, kcv))
+            for batch_start in range(0, new_chunks, BATCH_CHUNKS):
+                batch_end = min(batch_start + BATCH_CHUNKS, new_chunks)
+                record_pos = _HEADER.size + batch_start * DIGEST_SIZE
+                # Digest lama untuk batch ini (kosong untuk potongan di luar file lama)
+                if old_plain is not None:
+                    old_digests = b''.join(_digest(old_plain.read(chunk_size))
+                                           for _ in range(batch_start, min(batch_end, old_chunks)))
+                elif not rewrite_sidecar:
+                    sc.seek(record_pos)
+                    old_digests = sc.read((min(batch_end, old_chunks) - batch_start) * DIGEST_SIZE) if batch_start < old_chunks else b''
+                else:
+                    old_digests = b''
+                new_digests = bytearray()
+                for i in range(batch_start, batch_end):
+                    data = fin.read(chunk_size)
+                    digest = _digest(data)
+                    new_digests += digest
+                    k = (i - batch_start) * DIGEST_SIZE
+                    if old_digests[k:k + DIGEST_SIZE] == digest:
+                        continue
+                    # Potongan berubah: enkripsi dan tulis di offset yang sama
+                    offset = i * chunk_size
+                    fout.seek(offset)
+                    fout.write(_encrypt_chunk(core, data, rk))
+                    end = offset + len(data)
+                    if ranges and ranges[-1][1] == offset:
+                        ranges[-1] = (ranges[-1][0], end) # Gabungkan dengan rentang sebelumnya
+                    else:
+                        ranges.append((offset, end))
+                if rewrite_sidecar or bytes(new_digests) != old_digests:
+                    sc.seek(record_pos)
+                    sc.write(new_digests)
+            # File baru lebih pendek: buang sisa ciphertext dan record sidecar lama
+            if new_len < old_len:
+                fout.truncate(_padded(new_len))
+                sc.truncate(_HEADER.size + new_chunks * DIGEST_SIZE)
+    finally:
+        if old_plain is not None:
+            old_plain.close()
+    return ranges, new_chunks
@@ -0,0 +1,250 @@
+"""
+Analisis Codebook Seluruh Ruang Kunci Mini-AES
+Fitur:
+1. Codebook lengkap (2^16 blok) untuk setiap kunci, dihitung per lajur byte sekaligus
+   (MiniAESCorePurePython.codebook_int), dibagi ke beberapa proses worker
+2. Kunci ekuivalen: permutasi di-hash, tabrakan hash diverifikasi dengan membandingkan
+   codebook lengkap
+3. Titik tetap (E_K(p) = p) dan struktur siklus permutasi tiap kunci; kunci involusi
+   (E_K = D_K, semua siklus panjang <= 2) dilaporkan sebagai kunci lemah
+4. Tabel ringkasan per kunci yang ringkas (biner, satu record berukuran tetap per kunci)
+
+Biaya: 2^16 codebook x 2^16 blok = 2^32 nilai. Codebook hanya 1-4 ms per kunci; bagian
+terberat adalah penelusuran siklus (loop Python per blok, ~15 ms per kunci), sehingga
+seluruh ruang kunci memakan sekitar 20 menit untuk satu worker. Bagi dengan `workers`
+atau batasi dengan rentang kunci (`start`, `count`).
+"""
+
+import hashlib
+import struct
+import sys
+import time
+
+from encrypt_decrypt import MiniAESCorePurePython
+
+KEYSPACE = 1 << 16 # Jumlah kunci (dan jumlah blok) 16-bit
+BATCH_KEYS = 256   # Jumlah kunci per tugas worker
+HASH_SIZE = 8      # Ukuran hash permutasi (byte)
+SUMMARY_MAGIC = b"MAESKS1\x00"
+# Header tabel ringkasan: magic, kunci pertama, jumlah kunci
+_HEADER = struct.Struct("<8sII")
+# Record per kunci: hash permutasi, titik tetap, jumlah siklus, siklus panjang 2, siklus terpanjang
+_RECORD = struct.Struct("<QIIII")
+
+# ---- Analisis Satu Permutasi ----
+def permutation_hash(codebook):
+    """Hash 64-bit dari codebook (array('H')); codebook identik -> hash identik."""
+    return int.from_bytes(hashlib.blake2b(codebook.tobytes(), digest_size=HASH_SIZE).digest(), 'little')
+
+def cycle_lengths(perm):
+    """
+    Dekomposisi siklus sebuah permutasi (urutan indeks 0..n-1). Mengembalikan list panjang siklus.
+
+    Penelusuran berbasis array: bytearray `seen` menandai elemen yang sudah dikunjungi,
+    dan awal siklus berikutnya dicari dengan seen.find (di C), bukan loop Python.
+    """
+    seen = bytearray(len(perm))
+    find = seen.find
+    lengths = []
+    start = find(0)
+    while start != -1:
+        seen[start] = 1
+        x, n = perm[start], 1
+        while x != start:
+            seen[x] = 1
+            x = perm[x]
+            n += 1
+        lengths.append(n)
+        start = find(0, start + 1)
+    return lengths
+
+def summarize_key(core, key):
+    """Ringkasan satu kunci: (hash, titik tetap, jumlah siklus, siklus panjang 2, siklus terpanjang)."""
+    codebook = core.codebook_int(core.expand_key_int(key))
+    lengths = cycle_lengths(codebook.tolist())
+    return (permutation_hash(codebook), lengths.count(1), len(lengths), lengths.count(2), max(lengths))
+
+# ---- Worker ----
+_worker_core = None
+
+def _init_worker(core):
+    """Initializer proses worker: simpan core sebagai global."""
+    global _worker_core
+    _worker_core = core
+
+def _summarize_range(key_range):
+    """Tugas worker: record ringkasan (bytes) untuk satu rentang kunci."""
+    core = _worker_core
+    return b''.join(_RECORD.pack(*summarize_key(core, k)) for k in key_range)
+
+# ---- Hasil Analisis ----
+class KeyspaceResult:
+    """Hasil analisis ruang kunci: record per kunci dan kelompok kunci ekuivalen."""
+    def __init__(self, start, records, equivalent, elapsed):
+        self.start = start
+        self.records = records       # List tuple record (lihat _RECORD), indeks = kunci - start
+        self.equivalent = equivalent # List tuple kunci yang menghasilkan permutasi identik
+        self.elapsed = elapsed
+
+    def key_record(self, key):
+        """Record ringkasan untuk satu kunci (dict)."""
+        h, fixed, cycles, two, longest = self.records[key - self.start]
+        return {"hash": h, "fixed_points": fixed, "cycles": cycles, "two_cycles": two, "longest_cycle": longest}
+
+    def involutions(self):
+        """Kunci lemah dengan E_K = D_K: semua siklus berpanjang 1 atau 2."""
+        return [self.start + i for i, (_, fixed, cycles, two, _) in enumerate(self.records)
+                if fixed + two == cycles]
+
+    def report(self, top=10):
+        """Ringkasan hasil dalam bentuk teks."""
+        n = len(self.records)
+        end = self.start + n - 1
+        lines = [f"Kunci dianalisis       : {n} ({self.start:04X} - {end:04X})",
+                 f"Waktu                  : {self.elapsed:.1f} s"]
+        # Kunci ekuivalen / lemah
+        lines.append(f"Kelompok ekuivalen     : {len(self.equivalent)}")
+        for keys in self.equivalent[:20]:
+            lines.append("   " + " ".join(f"{k:04X}" for k in keys))
+        if len(self.equivalent) > 20:
+            lines.append(f"   ... ({len(self.equivalent) - 20} lainnya)")
+        weak = self.involutions()
+        lines.append(f"Kunci involusi (E=D)   : {len(weak)}" +
+                     (" -> " + " ".join(f"{k:04X}" for k in weak[:20]) if weak else ""))
+        # Titik tetap: untuk permutasi acak jumlahnya mendekati distribusi Poisson(1)
+        fixed = [r[1] for r in self.records]
+        histogram = {}
+        for f in fixed:
+            histogram[f] = histogram.get(f, 0) + 1
+        lines.append(f"Titik tetap rata-rata  : {sum(fixed) / n:.3f} (permutasi acak: 1)")
+        lines.append("Distribusi titik tetap : " +
+                     ", ".join(f"{f}:{histogram[f]}" for f in sorted(histogram)[:12]))
+        order = sorted(range(n), key=lambda i: -fixed[i])[:top]
+        lines.append("Titik tetap terbanyak  : " +
+                     ", ".join(f"{self.start + i:04X}({fixed[i]})" for i in order))
+        # Struktur siklus
+        cycles = [r[2] for r in self.records]
+        longest = [r[4] for r in self.records]
+        lines.append(f"Jumlah siklus          : min {min(cycles)}, rata-rata {sum(cycles) / n:.2f}, "
+                     f"maks {max(cycles)} (permutasi acak: ~{_harmonic(KEYSPACE):.2f})")
+        lines.append(f"Siklus terpanjang      : min {min(longest)}, rata-rata {sum(longest) / n:.0f}, "
+                     f"maks {max(longest)} (permutasi acak: ~{0.6243 * KEYSPACE:.0f})")
+        even = sum(1 for c in cycles if (KEYSPACE - c) % 2 == 0)
+        lines.append(f"Permutasi genap        : {even} dari {n}")
+        return "\n".join(lines)
+
+def _harmonic(n):
+    """Bilangan harmonik H_n: rata-rata jumlah siklus permutasi acak berukuran n."""
+    return sum(1 / i for i in range(1, n + 1))
+
+# ---- Analisis Ruang Kunci ----
+def _find_equivalent(core, start, records):
+    """Kelompokkan kunci dengan hash sama, lalu verifikasi dengan codebook lengkap."""
+    by_hash = {}
+    for i, record in enumerate(records):
+        by_hash.setdefault(record[0], []).append(start + i)
+    groups = []
+    for keys in by_hash.values():
+        if len(keys) < 2:
+            continue
+        # Tabrakan hash bukan bukti: bandingkan codebook sebenarnya
+        by_codebook = {}
+        for k in keys:
+            by_codebook.setdefault(core.codebook_int(core.expand_key_int(k)).tobytes(), []).append(k)
+        groups.extend(tuple(g) for g in by_codebook.values() if len(g) > 1)
+    groups.sort()
+    return groups
+
+def analyze_keyspace(core=None, start=0, count=KEYSPACE, workers=1, verbose=False):
+    """
+    Analisis codebook untuk kunci start .. start+count-1.
+
+    Mengembalikan KeyspaceResult (record per kunci, kelompok kunci ekuivalen).
+    """
+    if not (0 <= start < KEYSPACE) or count < 1 or start + count > KEYSPACE:
+        raise ValueError("Rentang kunci harus berada di dalam 0000 - FFFF.")
+    core = core if core is not None else MiniAESCorePurePython()
+    t_start = time.perf_counter()
+    ranges = [range(s, min(s + BATCH_KEYS, start + count)) for s in range(start, start + count, BATCH_KEYS)]
+    records = []
+
+    def collect(done, data):
+        records.extend(_RECORD.iter_unpack(data))
+        if verbose:
+            rate = len(records) / (time.perf_counter() - t_start)
+            print(f"   Progres: {done}/{len(ranges)} batch ({rate:.0f} kunci/s)", flush=True)
+
+    if workers > 1:
+        import multiprocessing
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(core,)) as pool:
+            # imap menjaga urutan batch, sehingga indeks record = kunci - start
+            for done, data in enumerate(pool.imap(_summarize_range, ranges), 1):
+                collect(done, data)
+    else:
+        _init_worker(core)
+        for done, key_range in enumerate(ranges, 1):
+            collect(done, _summarize_range(key_range))
+    equivalent = _find_equivalent(core, start, records)
+    return KeyspaceResult(start, records, equivalent, time.perf_counter() - t_start)
+
+# ---- Tabel Ringkasan ----
+def write_summary(result, path):
+    """Menulis tabel ringkasan biner: header + satu record berukuran tetap per kunci."""
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(SUMMARY_MAGIC, result.start, len(result.records)))
+        for record in result.records:
+            f.write(_RECORD.pack(*record))
+
+def read_summary(path):
+    """Membaca tabel ringkasan. Mengembalikan (kunci pertama, list record)."""
+    with open(path, 'rb') as f:
+        raw = f.read(_HEADER.size)
+        if len(raw) != _HEADER.size:
+            raise ValueError("File ringkasan terlalu pendek.")
+        magic, start, count = _HEADER.unpack(raw)
+        if magic != SUMMARY_MAGIC:
+            raise ValueError("File ringkasan tidak dikenali (magic salah).")
+        data = f.read(count * _RECORD.size)
+    if len(data) != count * _RECORD.size:
+        raise ValueError("File ringkasan terpotong.")
+    return start, list(_RECORD.iter_unpack(data))
+
+# =================================
+# Blok eksekusi utama
+# =================================
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Analisis codebook seluruh ruang kunci Mini-AES")
+    parser.add_argument('-o', '--output', help="File tabel ringkasan per kunci (biner)")
+    parser.add_argument('--start', default="0000", help="Kunci pertama (hex 4-karakter, default: 0000)")
+    parser.add_argument('--count', type=int, default=KEYSPACE, help="Jumlah kunci yang dianalisis (default: semua 65536)")
+    parser.add_argument('--workers', type=int, default=1, help="Jumlah proses worker")
+    parser.add_argument('--key', help="Tampilkan ringkasan satu kunci dari hasil (hex 4-karakter)")
+    args = parser.parse_args()
+
+    try:
+        if len(args.start) != 4:
+            raise ValueError("Kunci pertama harus berupa string hex 4-karakter (16-bit).")
+        start = int(args.start, 16)
+        key = None
+        if args.key is not None:
+            if len(args.key) != 4:
+                raise ValueError("Kunci harus berupa string hex 4-karakter (16-bit).")
+            key = int(args.key, 16)
+            if not (start <= key < start + args.count):
+                raise ValueError("Kunci --key berada di luar rentang yang dianalisis.")
+        result = analyze_keyspace(start=start, count=args.count, workers=args.workers, verbose=True)
+    except ValueError as e:
+        print(f"Error Validasi: {e}")
+        sys.exit(1)
+
+    print(result.report())
+    if key is not None:
+        record = result.key_record(key)
+        print(f"Kunci {key:04X}: " + ", ".join(f"{name}={value}" for name, value in record.items()))
+    if args.output:
+        write_summary(result, args.output)
+        print(f"Tabel ringkasan ({len(result.records)} kunci) disimpan ke {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -6,20 +6,30 @@ Fitur:
 3. Tampilan proses tiap round
 4. Support input teks/hex/file
 5. Uji Avalanche Effect (sensitivitas perubahan 1-bit pada plaintext/key)
+6. Mode terautentikasi AUTH (CBC + tag CMAC dalam satu kali baca) untuk file
+7. Enkripsi ulang inkremental ECB: hanya blok file yang berubah yang ditulis ulang
+8. Rotasi kunci (rekey): ciphertext kunci lama -> ciphertext kunci baru dalam satu pass
 """
 
-from encrypt_decrypt import MiniAESCorePurePython
-import argparse
 import sys
-import random 
 
 # ---- Konstanta Mode Operasi ----
 MODE_ECB = "ECB"
 MODE_CBC = "CBC"
+MODE_AUTH = "AUTH"  # CBC + tag CMAC multi-lane (lihat auth_mode.py), khusus file
 DEFAULT_IV = 0xFFFF  # Initialization Vector untuk CBC
 
 # ---- Inisialisasi Core Mini-AES ----
-mini_aes = MiniAESCorePurePython()
+# Dibuat saat pertama kali dibutuhkan (bukan saat import) agar startup CLI tetap ringan.
+_mini_aes = None
+
+def get_mini_aes():
+    """Mengembalikan instance MiniAESCorePurePython bersama, dibuat saat pertama kali dipakai."""
+    global _mini_aes
+    if _mini_aes is None:
+        from encrypt_decrypt import MiniAESCorePurePython
+        _mini_aes = MiniAESCorePurePython()
+    return _mini_aes
 
 # ---- Fungsi Bantuan ----
 def split_into_blocks(data_hex, block_size=4):
@@ -50,107 +60,126 @@ def hex_to_text(hex_str):
 def hex_to_state(hex_str):
     """Konversi hex string ke state format."""
     # Gunakan fungsi dari kelas MiniAES
-    return mini_aes.hex_to_state(hex_str)
+    return get_mini_aes().hex_to_state(hex_str)
 
 def state_to_hex(state):
     """Konversi state ke hex string."""
     # Gunakan fungsi dari kelas MiniAES
-    return mini_aes.state_to_hex(state)
+    return get_mini_aes().state_to_hex(state)
+
+def hex_to_blocks(data_hex):
+    """Konversi string hex (kelipatan 4 karakter) ke array blok 16-bit (int)."""
+    from encrypt_decrypt import bytes_to_blocks
+    if len(data_hex) % 4 != 0:
+        raise ValueError("String hex input harus terdiri dari 4 karakter.")
+    try:
+        # isalnum menolak spasi yang masih diterima bytes.fromhex
+        if data_hex and not data_hex.isalnum():
+            raise ValueError
+        return bytes_to_blocks(bytes.fromhex(data_hex))
+    except ValueError:
+        raise ValueError("Ditemukan karakter heksadesimal yang tidak valid.")
+
+def blocks_to_hex(blocks):
+    """Konversi array blok 16-bit (int) ke string hex (huruf besar)."""
+    from encrypt_decrypt import blocks_to_bytes
+    return blocks_to_bytes(blocks).hex().upper()
+
+def block_cipher(key_hex, decrypt=False, verbose=False):
+    """Mengembalikan fungsi blok int -> int untuk kunci ini (jalur cepat, atau jejak putaran jika verbose)."""
+    mini_aes = get_mini_aes()
+    key = mini_aes.hex_to_int(key_hex)
+    if verbose:
+        # Jejak putaran memakai API list lewat adapter int <-> state
+        key_state = mini_aes.int_to_state(key)
+        op = mini_aes.decrypt if decrypt else mini_aes.encrypt
+        return lambda block: mini_aes.state_to_int(op(mini_aes.int_to_state(block), key_state, verbose=True))
+    from functools import partial
+    op = mini_aes.decrypt_int if decrypt else mini_aes.encrypt_int
+    return partial(op, round_keys=mini_aes.expand_key_int(key))
 
 # ---- Mode Operasi ----
+# Semua mode bekerja pada state integer 16-bit: tidak ada list per blok, XOR CBC cukup satu operasi.
 def encrypt_ecb(plaintext_hex, key_hex, verbose=False):
     """Enkripsi dalam mode ECB."""
     # Pastikan input di-pad
-    padded_plaintext = pad_hex_string(plaintext_hex)
-    blocks = split_into_blocks(padded_plaintext)
-    ciphertext = []
-    key_state = hex_to_state(key_hex)
+    blocks = hex_to_blocks(pad_hex_string(plaintext_hex))
+    cipher = block_cipher(key_hex, verbose=verbose)
+    show = verbose and len(blocks) > 1
 
-    if verbose and len(blocks) > 1: print("\nMemproses Blok ECB (Enkripsi):")
+    if show: print("\nMemproses Blok ECB (Enkripsi):")
     for i, block in enumerate(blocks):
-        if verbose and len(blocks) > 1: print(f"\n--- Blok {i+1} ({block}) ---")
-        block_state = hex_to_state(block)
-        cipher_state = mini_aes.encrypt(block_state, key_state, verbose=verbose)
-        ciphertext.append(state_to_hex(cipher_state))
+        if show: print(f"\n--- Blok {i+1} ({block:04X}) ---")
+        blocks[i] = cipher(block)
 
-    return ''.join(ciphertext)
+    return blocks_to_hex(blocks)
 
 def decrypt_ecb(ciphertext_hex, key_hex, verbose=False):
     """Dekripsi dalam mode ECB."""
     # Periksa panjang ciphertext, idealnya kelipatan 4
     if len(ciphertext_hex) % 4 != 0:
         print("Peringatan: Panjang ciphertext tidak kelipatan 4. Hasil mungkin tidak akurat.")
-    blocks = split_into_blocks(ciphertext_hex)
-    plaintext = []
-    key_state = hex_to_state(key_hex)
+    blocks = hex_to_blocks(ciphertext_hex)
+    cipher = block_cipher(key_hex, decrypt=True, verbose=verbose)
+    show = verbose and len(blocks) > 1
 
-    if verbose and len(blocks) > 1: print("\nMemproses Blok ECB (Dekripsi):")
+    if show: print("\nMemproses Blok ECB (Dekripsi):")
     for i, block in enumerate(blocks):
-        if verbose and len(blocks) > 1: print(f"\n--- Blok {i+1} ({block}) ---")
-        block_state = hex_to_state(block)
-        plain_state = mini_aes.decrypt(block_state, key_state, verbose=verbose)
-        plaintext.append(state_to_hex(plain_state))
+        if show: print(f"\n--- Blok {i+1} ({block:04X}) ---")
+        blocks[i] = cipher(block)
 
-    return ''.join(plaintext)
+    return blocks_to_hex(blocks)
 
 def encrypt_cbc(plaintext_hex, key_hex, iv=DEFAULT_IV, verbose=False):
     """Enkripsi dalam mode CBC."""
     # Pastikan input di-pad
-    padded_plaintext = pad_hex_string(plaintext_hex)
-    blocks = split_into_blocks(padded_plaintext)
-    ciphertext = []
-    # Konversi IV ke state
-    prev_block_state = hex_to_state(f"{iv:04X}")
-    key_state = hex_to_state(key_hex)
+    blocks = hex_to_blocks(pad_hex_string(plaintext_hex))
+    cipher = block_cipher(key_hex, verbose=verbose)
+    show = verbose and len(blocks) > 1
+    prev_block = iv
 
     if verbose: print(f"\nMenggunakan IV: {iv:04X}")
-    if verbose and len(blocks) > 1: print("\nMemproses Blok CBC (Enkripsi):")
+    if show: print("\nMemproses Blok CBC (Enkripsi):")
     for i, block in enumerate(blocks):
-        if verbose and len(blocks) > 1: print(f"\n--- Blok {i+1} ({block}) ---")
-        block_state = hex_to_state(block)
+        if show: print(f"\n--- Blok {i+1} ({block:04X}) ---")
         # XOR dengan blok sebelumnya (atau IV)
-        if verbose and len(blocks) > 1: print(f"   XOR dengan Prev CT/IV ({state_to_hex(prev_block_state)})")
-        xor_block_state = [block_state[j] ^ prev_block_state[j] for j in range(4)]
-        if verbose and len(blocks) > 1: print(f"   -> Hasil XOR: {state_to_hex(xor_block_state)}")
+        if show: print(f"   XOR dengan Prev CT/IV ({prev_block:04X})")
+        xor_block = block ^ prev_block
+        if show: print(f"   -> Hasil XOR: {xor_block:04X}")
 
-        # Enkripsi hasil XOR
-        cipher_state = mini_aes.encrypt(xor_block_state, key_state, verbose=verbose)
-        ciphertext.append(state_to_hex(cipher_state))
-        # Simpan state ciphertext saat ini untuk blok berikutnya
-        prev_block_state = cipher_state
+        # Enkripsi hasil XOR, simpan ciphertext saat ini untuk blok berikutnya
+        prev_block = cipher(xor_block)
+        blocks[i] = prev_block
 
-    return ''.join(ciphertext)
+    return blocks_to_hex(blocks)
 
 def decrypt_cbc(ciphertext_hex, key_hex, iv=DEFAULT_IV, verbose=False):
     """Dekripsi dalam mode CBC."""
     # Periksa panjang ciphertext
     if len(ciphertext_hex) % 4 != 0:
         print("Peringatan: Panjang ciphertext tidak kelipatan 4. Hasil mungkin tidak akurat.")
-    blocks = split_into_blocks(ciphertext_hex)
-    plaintext = []
-    # Konversi IV ke state
-    prev_block_state = hex_to_state(f"{iv:04X}")
-    key_state = hex_to_state(key_hex)
+    blocks = hex_to_blocks(ciphertext_hex)
+    cipher = block_cipher(key_hex, decrypt=True, verbose=verbose)
+    show = verbose and len(blocks) > 1
+    prev_block = iv
 
     if verbose: print(f"\nMenggunakan IV: {iv:04X}")
-    if verbose and len(blocks) > 1: print("\nMemproses Blok CBC (Dekripsi):")
+    if show: print("\nMemproses Blok CBC (Dekripsi):")
     for i, block in enumerate(blocks):
-        current_block_state = hex_to_state(block) # Simpan state ciphertext blok ini
-        if verbose and len(blocks) > 1: print(f"\n--- Blok {i+1} ({block}) ---")
+        if show: print(f"\n--- Blok {i+1} ({block:04X}) ---")
 
         # Dekripsi blok ciphertext saat ini
-        decrypted_state = mini_aes.decrypt(current_block_state, key_state, verbose=verbose)
+        decrypted = cipher(block)
 
         # XOR hasil dekripsi dengan blok ciphertext sebelumnya (atau IV)
-        if verbose and len(blocks) > 1: print(f"   XOR dengan Prev CT/IV ({state_to_hex(prev_block_state)})")
-        xor_block_state = [decrypted_state[j] ^ prev_block_state[j] for j in range(4)]
-        plaintext.append(state_to_hex(xor_block_state))
-        if verbose and len(blocks) > 1: print(f"   -> Hasil Plaintext Blok: {state_to_hex(xor_block_state)}")
+        if show: print(f"   XOR dengan Prev CT/IV ({prev_block:04X})")
+        blocks[i] = decrypted ^ prev_block
+        if show: print(f"   -> Hasil Plaintext Blok: {blocks[i]:04X}")
 
         # Update blok sebelumnya untuk iterasi berikutnya
-        prev_block_state = current_block_state
+        prev_block = block
 
-    return ''.join(plaintext)
+    return blocks_to_hex(blocks)
 
 # ---- Fungsi untuk Uji Avalanche Effect ---- (Bagian Baru)
 def hamming_distance(hex_str1, hex_str2):
@@ -172,6 +201,8 @@ def hamming_distance(hex_str1, hex_str2):
 
 def test_avalanche_effect(plaintext_hex, key_hex):
     """Menjalankan tes Avalanche Effect untuk Mini-AES (1 blok)."""
+    import random # Hanya dibutuhkan oleh tes ini
+    mini_aes = get_mini_aes()
     # Validasi input spesifik untuk tes ini
     if len(plaintext_hex) != 4 or len(key_hex) != 4:
         print("Error: Tes Avalanche memerlukan tepat satu blok 16-bit (4 karakter hex) untuk plaintext dan kunci.")
@@ -179,12 +210,11 @@ def test_avalanche_effect(plaintext_hex, key_hex):
 
     print("\n--- Uji Avalanche Effect ---")
     # 0. Enkripsi original sebagai basis perbandingan
-    pt_state_orig = hex_to_state(plaintext_hex)
-    key_state_orig = hex_to_state(key_hex)
+    pt_int = mini_aes.hex_to_int(plaintext_hex)
+    key_int = mini_aes.hex_to_int(key_hex)
     try:
-        # Enkripsi tanpa verbose internal agar output tes lebih bersih
-        original_ct_state = mini_aes.encrypt(pt_state_orig, key_state_orig, verbose=False)
-        original_ct_hex = state_to_hex(original_ct_state)
+        # Enkripsi jalur cepat (tanpa jejak putaran) agar output tes lebih bersih
+        original_ct_hex = mini_aes.int_to_hex(mini_aes.encrypt_int(pt_int, mini_aes.expand_key_int(key_int)))
         print(f"Original PT: {plaintext_hex}, Key: {key_hex} -> CT: {original_ct_hex}")
     except Exception as e:
         print(f"Error saat enkripsi original untuk tes: {e}")
@@ -197,16 +227,13 @@ def test_avalanche_effect(plaintext_hex, key_hex):
         print(f"\n1. Mengubah 1 bit acak pada Plaintext ({plaintext_hex}):")
         # Pilih posisi bit yang akan diubah (0 sampai 15)
         bit_pos_pt = random.randint(0, total_bits - 1)
-        pt_int = int(plaintext_hex, 16)
         # Balik bit pada posisi terpilih menggunakan XOR dan bitmask
         flipped_pt_int = pt_int ^ (1 << bit_pos_pt)
         # Format kembali ke hex 4 karakter (dengan padding '0' jika perlu)
-        flipped_pt_hex = f"{flipped_pt_int:04X}"
-        flipped_pt_state = hex_to_state(flipped_pt_hex)
+        flipped_pt_hex = mini_aes.int_to_hex(flipped_pt_int)
 
         # Enkripsi plaintext yang sudah diubah
-        flipped_pt_ct_state = mini_aes.encrypt(flipped_pt_state, key_state_orig, verbose=False)
-        flipped_pt_ct_hex = state_to_hex(flipped_pt_ct_state)
+        flipped_pt_ct_hex = mini_aes.int_to_hex(mini_aes.encrypt_int(flipped_pt_int, mini_aes.expand_key_int(key_int)))
         # Hitung perbedaan bit antara ciphertext asli dan yang baru
         pt_diff = hamming_distance(original_ct_hex, flipped_pt_ct_hex)
         pt_diff_percent = (pt_diff / total_bits) * 100
@@ -222,15 +249,12 @@ def test_avalanche_effect(plaintext_hex, key_hex):
         print(f"\n2. Mengubah 1 bit acak pada Kunci ({key_hex}):")
         # Pilih posisi bit yang akan diubah
         bit_pos_key = random.randint(0, total_bits - 1)
-        key_int = int(key_hex, 16)
         # Balik bit kunci
         flipped_key_int = key_int ^ (1 << bit_pos_key)
-        flipped_key_hex = f"{flipped_key_int:04X}"
-        flipped_key_state = hex_to_state(flipped_key_hex)
+        flipped_key_hex = mini_aes.int_to_hex(flipped_key_int)
 
         # Enkripsi plaintext asli dengan kunci yang sudah diubah
-        flipped_key_ct_state = mini_aes.encrypt(pt_state_orig, flipped_key_state, verbose=False)
-        flipped_key_ct_hex = state_to_hex(flipped_key_ct_state)
+        flipped_key_ct_hex = mini_aes.int_to_hex(mini_aes.encrypt_int(pt_int, mini_aes.expand_key_int(flipped_key_int)))
         # Hitung perbedaan bit
         key_diff = hamming_distance(original_ct_hex, flipped_key_ct_hex)
         key_diff_percent = (key_diff / total_bits) * 100
@@ -247,6 +271,8 @@ def test_avalanche_effect(plaintext_hex, key_hex):
 # ---- Fungsi Utama ----
 def process_file(input_file, output_file, key_hex, mode, action, iv=DEFAULT_IV, verbose=False):
     """Proses enkripsi/dekripsi file."""
+    if not verbose:
+        return process_file_pipelined(input_file, output_file, key_hex, mode, action, iv)
     try:
         # Baca file sebagai bytes, lalu konversi ke hex string
         with open(input_file, 'rb') as f:
@@ -278,21 +304,154 @@ def process_file(input_file, output_file, key_hex, mode, action, iv=DEFAULT_IV,
         print(f"Error saat memproses file: {e}")
         sys.exit(1)
 
-def main():
+def process_file_pipelined(input_file, output_file, key_hex, mode, action, iv=DEFAULT_IV):
+    """Proses file lewat pipeline baca/cipher/tulis paralel (lihat pipeline.py); hasil identik dengan process_file."""
+    import os
+    import pipeline # Diimport hanya saat memproses file
+    try:
+        print(f"Membaca file '{input_file}' ({os.path.getsize(input_file)} bytes).")
+        cipher = block_cipher(key_hex, decrypt=(action == 'decrypt'))
+        if mode == MODE_ECB:
+            transform = pipeline.ecb_transform(cipher)
+        elif action == 'encrypt': # MODE_CBC
+            transform = pipeline.cbc_encrypt_transform(cipher, iv)
+        else:
+            transform = pipeline.cbc_decrypt_transform(cipher, iv)
+        pipeline.process_file(input_file, output_file, transform, pad=(action == 'encrypt'))
+        print(f"File berhasil di-{action}! Output disimpan ke {output_file}")
+
+    except FileNotFoundError:
+         print(f"Error: File input '{input_file}' tidak ditemukan.")
+         sys.exit(1)
+    except Exception as e:
+        print(f"Error saat memproses file: {e}")
+        sys.exit(1)
+
+def process_file_authenticated(input_file, output_file, key_hex, action, iv=DEFAULT_IV, tag_blocks=None):
+    """Proses file dengan mode AUTH: enkripsi + tag dalam satu kali baca, atau verifikasi lalu dekripsi."""
+    import auth_mode # Diimport hanya saat mode AUTH dipakai
+    if tag_blocks is None:
+        tag_blocks = auth_mode.DEFAULT_TAG_BLOCKS
+    try:
+        key = int(key_hex, 16)
+        if action == 'encrypt':
+            size = auth_mode.encrypt_file(get_mini_aes(), input_file, output_file, key, iv, tag_blocks)
+            print(f"Membaca file '{input_file}' ({size} bytes), tag {16 * tag_blocks}-bit ditambahkan.")
+        else: # action == 'decrypt'
+            # Tag diverifikasi lebih dulu; plaintext tidak ditulis jika file ditolak
+            size = auth_mode.decrypt_file(get_mini_aes(), input_file, output_file, key, iv, tag_blocks)
+            print(f"Tag autentikasi valid ({size} bytes didekripsi).")
+        print(f"File berhasil di-{action}! Output disimpan ke {output_file}")
+
+    except FileNotFoundError:
+         print(f"Error: File input '{input_file}' tidak ditemukan.")
+         sys.exit(1)
+    except Exception as e:
+        print(f"Error saat memproses file: {e}")
+        sys.exit(1)
+
+def process_file_incremental(input_file, output_file, key_hex, old_plain=None, sidecar=None):
+    """Perbarui ciphertext ECB di tempat: hanya potongan plaintext yang berubah yang dienkripsi ulang."""
+    import incremental # Diimport hanya saat mode inkremental dipakai
+    try:
+        ranges, chunks = incremental.reencrypt_ecb(get_mini_aes(), input_file, output_file, int(key_hex, 16),
+                                                   old_plain_file=old_plain, sidecar_file=sidecar)
+        rewritten = sum(end - start for start, end in ranges)
+        print(f"Membaca file '{input_file}' ({chunks} potongan).")
+        print(f"{len(ranges)} rentang berubah, {rewritten} bytes ditulis ulang.")
+        for start, end in ranges[:10]:
+            print(f"   byte {start} - {end}")
+        if len(ranges) > 10:
+            print(f"   ... ({len(ranges) - 10} rentang lainnya)")
+        print(f"File berhasil di-encrypt! Output diperbarui di {output_file}")
+
+    except FileNotFoundError as e:
+         print(f"Error: File '{e.filename}' tidak ditemukan.")
+         sys.exit(1)
+    except Exception as e:
+        print(f"Error saat memproses file: {e}")
+        sys.exit(1)
+
+def run_rekey(args, key_hex, iv_int):
+    """Aksi rekey: ganti kunci (dan IV) ciphertext dalam satu pass tanpa menyimpan plaintext."""
+    import rekey # Diimport hanya saat aksi rekey dipakai
+    if not args.new_key:
+        raise ValueError("--new-key (hex 4-karakter, 16-bit) wajib untuk aksi rekey.")
+    core = get_mini_aes()
+    # hex_to_int menolak tanda/prefiks seperti '0x12' yang diterima int(x, 16)
+    new_key = core.hex_to_int(args.new_key)
+    new_iv = iv_int if args.new_iv is None else core.hex_to_int(args.new_iv)
+    old_key = core.hex_to_int(key_hex)
+
+    if args.file:
+        if not args.output:
+            print("Error: Output file path (-o) required when processing files (-f)")
+            sys.exit(1)
+        try:
+            if args.mode == MODE_ECB:
+                size = rekey.rekey_file_ecb(core, args.input, args.output, old_key, new_key)
+            elif args.mode == MODE_CBC:
+                size = rekey.rekey_file_cbc(core, args.input, args.output, old_key, new_key, iv_int, new_iv)
+            else: # MODE_AUTH
+                size = rekey.rekey_file_auth(core, args.input, args.output, old_key, new_key, iv_int, new_iv, args.tag_blocks)
+            print(f"Membaca file '{args.input}' ({size} bytes ciphertext).")
+            print(f"File berhasil di-rekey! Output disimpan ke {args.output}")
+        except FileNotFoundError:
+             print(f"Error: File input '{args.input}' tidak ditemukan.")
+             sys.exit(1)
+        except Exception as e:
+            print(f"Error saat memproses file: {e}")
+            sys.exit(1)
+        return
+
+    # Input string: ciphertext hex
+    if args.mode == MODE_AUTH:
+        print("Error: Mode AUTH hanya mendukung input file (-f).")
+        sys.exit(1)
+    blocks = hex_to_blocks(args.input.upper())
+    if args.mode == MODE_ECB:
+        blocks = rekey.rekey_ecb_blocks(blocks, rekey.ecb_rekey_function(core, old_key, new_key, len(blocks)))
+    else: # MODE_CBC
+        decrypt, encrypt = rekey.cbc_rekey_functions(core, old_key, new_key, len(blocks))
+        rekey.rekey_cbc_blocks(blocks, decrypt, encrypt, iv_int, new_iv)
+    result_hex = blocks_to_hex(blocks)
+    print(f"\n--- Hasil ({args.mode} rekey) ---")
+    print(f"Hex : {result_hex}")
+    if args.output:
+        try:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(result_hex)
+            print(f"\nHasil hex disimpan ke {args.output}")
+        except IOError as e:
+             print(f"\nError: Gagal menulis ke file output '{args.output}': {e}")
+
+def build_parser():
+    """Membangun parser argumen CLI (argparse diimport di sini, bukan saat import modul)."""
+    import argparse
     parser = argparse.ArgumentParser(description="Mini-AES Encryption/Decryption Tool")
-    parser.add_argument('action', choices=['encrypt', 'decrypt'], help="Action to perform")
+    parser.add_argument('action', choices=['encrypt', 'decrypt', 'rekey'], help="Action to perform (rekey: ganti kunci ciphertext)")
     parser.add_argument('input', help="Input (text, hex string, or file)")
     parser.add_argument('key', help="Encryption key (16-bit hex, e.g., A73B)")
-    parser.add_argument('-m', '--mode', choices=[MODE_ECB, MODE_CBC], default=MODE_ECB, help="Block cipher mode")
+    parser.add_argument('-m', '--mode', choices=[MODE_ECB, MODE_CBC, MODE_AUTH], default=MODE_ECB, help="Block cipher mode (AUTH = CBC + tag CMAC, khusus file)")
     # Tambahkan argumen IV untuk CBC
     parser.add_argument('--iv', help="Initialization Vector (IV) hex 4-karakter untuk CBC (default: FFFF)", default=f"{DEFAULT_IV:04X}")
+    # Argumen rotasi kunci (aksi rekey); key positional = kunci lama
+    parser.add_argument('--new-key', help="Kunci baru (hex 4-karakter) untuk aksi rekey")
+    parser.add_argument('--new-iv', help="IV baru untuk rekey CBC/AUTH (default: sama dengan --iv)")
+    parser.add_argument('--tag-blocks', type=int, default=4, help="Jumlah blok 16-bit pada tag mode AUTH (default: 4 = 64-bit)")
+    # Argumen enkripsi ulang inkremental (ECB, file)
+    parser.add_argument('--incremental', action='store_true', help="Perbarui file output ECB di tempat, hanya blok yang berubah")
+    parser.add_argument('--old-plain', help="Plaintext versi lama sebagai acuan perubahan (default: sidecar <output>.blkhash)")
+    parser.add_argument('--sidecar', help="Lokasi file sidecar hash blok (default: <output>.blkhash)")
     parser.add_argument('-f', '--file', action='store_true', help="Treat input as file")
     parser.add_argument('-o', '--output', help="Output file path")
     parser.add_argument('-v', '--verbose', action='store_true', help="Show round details")
     # Tambahkan argumen untuk tes avalanche
     parser.add_argument('--avalanche', action='store_true', help="Jalankan tes avalanche effect (input & kunci harus hex 4-karakter)")
+    return parser
 
-    args = parser.parse_args()
+def main():
+    args = build_parser().parse_args()
 
     # --- Cek jika ingin menjalankan tes Avalanche --- (Bagian Baru)
     if args.avalanche:
@@ -328,9 +487,9 @@ def main():
         key_hex = args.key.upper() # Gunakan uppercase
         int(key_hex, 16)  # Validasi hex
 
-        # Validasi IV jika mode CBC
+        # Validasi IV jika mode CBC/AUTH
         iv_int = DEFAULT_IV
-        if args.mode == MODE_CBC:
+        if args.mode in (MODE_CBC, MODE_AUTH):
              try:
                  if len(args.iv) != 4:
                       raise ValueError("IV must be a 4-character hex string (16-bit).")
@@ -342,12 +501,32 @@ def main():
                   print(f"Error: Invalid IV provided - {e}")
                   sys.exit(1)
 
+        # Rotasi kunci: ciphertext lama langsung ke ciphertext baru
+        if args.action == 'rekey':
+            if args.tag_blocks < 1:
+                raise ValueError("--tag-blocks minimal 1.")
+            run_rekey(args, key_hex, iv_int)
+            return
+
         # Proses file atau string
         if args.file:
             if not args.output:
                 print("Error: Output file path (-o) required when processing files (-f)")
                 sys.exit(1)
+            if args.incremental:
+                if args.action != 'encrypt' or args.mode != MODE_ECB:
+                    raise ValueError("--incremental hanya untuk enkripsi mode ECB.")
+                process_file_incremental(args.input, args.output, key_hex, args.old_plain, args.sidecar)
+                return
+            if args.mode == MODE_AUTH:
+                if args.tag_blocks < 1:
+                    raise ValueError("--tag-blocks minimal 1.")
+                process_file_authenticated(args.input, args.output, key_hex, args.action, iv_int, args.tag_blocks)
+                return
             process_file(args.input, args.output, key_hex, args.mode, args.action, iv_int, args.verbose)
+        elif args.mode == MODE_AUTH or args.incremental:
+            print("Error: Mode AUTH dan --incremental hanya mendukung input file (-f).")
+            sys.exit(1)
         else:
             # Handle input string (teks atau hex)
             input_data = args.input
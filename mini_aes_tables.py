@@ -0,0 +1,254 @@
+"""
+Tabel lookup terfusi Mini-AES standar (parameter Phan) yang sudah dihitung sebelumnya.
+
+File ini dihasilkan otomatis dengan `python mini_aes_tables.py`; jangan diedit manual.
+MiniAESCorePurePython() memakai konstanta ini sehingga tabel tidak perlu diturunkan
+ulang setiap kali program dijalankan. Varian kustom tetap mengompilasi tabelnya sendiri.
+"""
+
+# @@TABLES@@
+SUB_BYTE = (
+    0xEE, 0xE4, 0xED, 0xE1, 0xE2, 0xEF, 0xEB, 0xE8, 0xE3, 0xEA, 0xE6, 0xEC, 0xE5, 0xE9, 0xE0, 0xE7,
+    0x4E, 0x44, 0x4D, 0x41, 0x42, 0x4F, 0x4B, 0x48, 0x43, 0x4A, 0x46, 0x4C, 0x45, 0x49, 0x40, 0x47,
+    0xDE, 0xD4, 0xDD, 0xD1, 0xD2, 0xDF, 0xDB, 0xD8, 0xD3, 0xDA, 0xD6, 0xDC, 0xD5, 0xD9, 0xD0, 0xD7,
+    0x1E, 0x14, 0x1D, 0x11, 0x12, 0x1F, 0x1B, 0x18, 0x13, 0x1A, 0x16, 0x1C, 0x15, 0x19, 0x10, 0x17,
+    0x2E, 0x24, 0x2D, 0x21, 0x22, 0x2F, 0x2B, 0x28, 0x23, 0x2A, 0x26, 0x2C, 0x25, 0x29, 0x20, 0x27,
+    0xFE, 0xF4, 0xFD, 0xF1, 0xF2, 0xFF, 0xFB, 0xF8, 0xF3, 0xFA, 0xF6, 0xFC, 0xF5, 0xF9, 0xF0, 0xF7,
+    0xBE, 0xB4, 0xBD, 0xB1, 0xB2, 0xBF, 0xBB, 0xB8, 0xB3, 0xBA, 0xB6, 0xBC, 0xB5, 0xB9, 0xB0, 0xB7,
+    0x8E, 0x84, 0x8D, 0x81, 0x82, 0x8F, 0x8B, 0x88, 0x83, 0x8A, 0x86, 0x8C, 0x85, 0x89, 0x80, 0x87,
+    0x3E, 0x34, 0x3D, 0x31, 0x32, 0x3F, 0x3B, 0x38, 0x33, 0x3A, 0x36, 0x3C, 0x35, 0x39, 0x30, 0x37,
+    0xAE, 0xA4, 0xAD, 0xA1, 0xA2, 0xAF, 0xAB, 0xA8, 0xA3, 0xAA, 0xA6, 0xAC, 0xA5, 0xA9, 0xA0, 0xA7,
+    0x6E, 0x64, 0x6D, 0x61, 0x62, 0x6F, 0x6B, 0x68, 0x63, 0x6A, 0x66, 0x6C, 0x65, 0x69, 0x60, 0x67,
+    0xCE, 0xC4, 0xCD, 0xC1, 0xC2, 0xCF, 0xCB, 0xC8, 0xC3, 0xCA, 0xC6, 0xCC, 0xC5, 0xC9, 0xC0, 0xC7,
+    0x5E, 0x54, 0x5D, 0x51, 0x52, 0x5F, 0x5B, 0x58, 0x53, 0x5A, 0x56, 0x5C, 0x55, 0x59, 0x50, 0x57,
+    0x9E, 0x94, 0x9D, 0x91, 0x92, 0x9F, 0x9B, 0x98, 0x93, 0x9A, 0x96, 0x9C, 0x95, 0x99, 0x90, 0x97,
+    0x0E, 0x04, 0x0D, 0x01, 0x02, 0x0F, 0x0B, 0x08, 0x03, 0x0A, 0x06, 0x0C, 0x05, 0x09, 0x00, 0x07,
+    0x7E, 0x74, 0x7D, 0x71, 0x72, 0x7F, 0x7B, 0x78, 0x73, 0x7A, 0x76, 0x7C, 0x75, 0x79, 0x70, 0x77,
+)
+INV_SUB_BYTE = (
+    0xEE, 0xE3, 0xE4, 0xE8, 0xE1, 0xEC, 0xEA, 0xEF, 0xE7, 0xED, 0xE9, 0xE6, 0xEB, 0xE2, 0xE0, 0xE5,
+    0x3E, 0x33, 0x34, 0x38, 0x31, 0x3C, 0x3A, 0x3F, 0x37, 0x3D, 0x39, 0x36, 0x3B, 0x32, 0x30, 0x35,
+    0x4E, 0x43, 0x44, 0x48, 0x41, 0x4C, 0x4A, 0x4F, 0x47, 0x4D, 0x49, 0x46, 0x4B, 0x42, 0x40, 0x45,
+    0x8E, 0x83, 0x84, 0x88, 0x81, 0x8C, 0x8A, 0x8F, 0x87, 0x8D, 0x89, 0x86, 0x8B, 0x82, 0x80, 0x85,
+    0x1E, 0x13, 0x14, 0x18, 0x11, 0x1C, 0x1A, 0x1F, 0x17, 0x1D, 0x19, 0x16, 0x1B, 0x12, 0x10, 0x15,
+    0xCE, 0xC3, 0xC4, 0xC8, 0xC1, 0xCC, 0xCA, 0xCF, 0xC7, 0xCD, 0xC9, 0xC6, 0xCB, 0xC2, 0xC0, 0xC5,
+    0xAE, 0xA3, 0xA4, 0xA8, 0xA1, 0xAC, 0xAA, 0xAF, 0xA7, 0xAD, 0xA9, 0xA6, 0xAB, 0xA2, 0xA0, 0xA5,
+    0xFE, 0xF3, 0xF4, 0xF8, 0xF1, 0xFC, 0xFA, 0xFF, 0xF7, 0xFD, 0xF9, 0xF6, 0xFB, 0xF2, 0xF0, 0xF5,
+    0x7E, 0x73, 0x74, 0x78, 0x71, 0x7C, 0x7A, 0x7F, 0x77, 0x7D, 0x79, 0x76, 0x7B, 0x72, 0x70, 0x75,
+    0xDE, 0xD3, 0xD4, 0xD8, 0xD1, 0xDC, 0xDA, 0xDF, 0xD7, 0xDD, 0xD9, 0xD6, 0xDB, 0xD2, 0xD0, 0xD5,
+    0x9E, 0x93, 0x94, 0x98, 0x91, 0x9C, 0x9A, 0x9F, 0x97, 0x9D, 0x99, 0x96, 0x9B, 0x92, 0x90, 0x95,
+    0x6E, 0x63, 0x64, 0x68, 0x61, 0x6C, 0x6A, 0x6F, 0x67, 0x6D, 0x69, 0x66, 0x6B, 0x62, 0x60, 0x65,
+    0xBE, 0xB3, 0xB4, 0xB8, 0xB1, 0xBC, 0xBA, 0xBF, 0xB7, 0xBD, 0xB9, 0xB6, 0xBB, 0xB2, 0xB0, 0xB5,
+    0x2E, 0x23, 0x24, 0x28, 0x21, 0x2C, 0x2A, 0x2F, 0x27, 0x2D, 0x29, 0x26, 0x2B, 0x22, 0x20, 0x25,
+    0x0E, 0x03, 0x04, 0x08, 0x01, 0x0C, 0x0A, 0x0F, 0x07, 0x0D, 0x09, 0x06, 0x0B, 0x02, 0x00, 0x05,
+    0x5E, 0x53, 0x54, 0x58, 0x51, 0x5C, 0x5A, 0x5F, 0x57, 0x5D, 0x59, 0x56, 0x5B, 0x52, 0x50, 0x55,
+)
+MIX_BYTE = (
+    0x00, 0x23, 0x46, 0x65, 0x8C, 0xAF, 0xCA, 0xE9, 0x3B, 0x18, 0x7D, 0x5E, 0xB7, 0x94, 0xF1, 0xD2,
+    0x32, 0x11, 0x74, 0x57, 0xBE, 0x9D, 0xF8, 0xDB, 0x09, 0x2A, 0x4F, 0x6C, 0x85, 0xA6, 0xC3, 0xE0,
+    0x64, 0x47, 0x22, 0x01, 0xE8, 0xCB, 0xAE, 0x8D, 0x5F, 0x7C, 0x19, 0x3A, 0xD3, 0xF0, 0x95, 0xB6,
+    0x56, 0x75, 0x10, 0x33, 0xDA, 0xF9, 0x9C, 0xBF, 0x6D, 0x4E, 0x2B, 0x08, 0xE1, 0xC2, 0xA7, 0x84,
+    0xC8, 0xEB, 0x8E, 0xAD, 0x44, 0x67, 0x02, 0x21, 0xF3, 0xD0, 0xB5, 0x96, 0x7F, 0x5C, 0x39, 0x1A,
+    0xFA, 0xD9, 0xBC, 0x9F, 0x76, 0x55, 0x30, 0x13, 0xC1, 0xE2, 0x87, 0xA4, 0x4D, 0x6E, 0x0B, 0x28,
+    0xAC, 0x8F, 0xEA, 0xC9, 0x20, 0x03, 0x66, 0x45, 0x97, 0xB4, 0xD1, 0xF2, 0x1B, 0x38, 0x5D, 0x7E,
+    0x9E, 0xBD, 0xD8, 0xFB, 0x12, 0x31, 0x54, 0x77, 0xA5, 0x86, 0xE3, 0xC0, 0x29, 0x0A, 0x6F, 0x4C,
+    0xB3, 0x90, 0xF5, 0xD6, 0x3F, 0x1C, 0x79, 0x5A, 0x88, 0xAB, 0xCE, 0xED, 0x04, 0x27, 0x42, 0x61,
+    0x81, 0xA2, 0xC7, 0xE4, 0x0D, 0x2E, 0x4B, 0x68, 0xBA, 0x99, 0xFC, 0xDF, 0x36, 0x15, 0x70, 0x53,
+    0xD7, 0xF4, 0x91, 0xB2, 0x5B, 0x78, 0x1D, 0x3E, 0xEC, 0xCF, 0xAA, 0x89, 0x60, 0x43, 0x26, 0x05,
+    0xE5, 0xC6, 0xA3, 0x80, 0x69, 0x4A, 0x2F, 0x0C, 0xDE, 0xFD, 0x98, 0xBB, 0x52, 0x71, 0x14, 0x37,
+    0x7B, 0x58, 0x3D, 0x1E, 0xF7, 0xD4, 0xB1, 0x92, 0x40, 0x63, 0x06, 0x25, 0xCC, 0xEF, 0x8A, 0xA9,
+    0x49, 0x6A, 0x0F, 0x2C, 0xC5, 0xE6, 0x83, 0xA0, 0x72, 0x51, 0x34, 0x17, 0xFE, 0xDD, 0xB8, 0x9B,
+    0x1F, 0x3C, 0x59, 0x7A, 0x93, 0xB0, 0xD5, 0xF6, 0x24, 0x07, 0x62, 0x41, 0xA8, 0x8B, 0xEE, 0xCD,
+    0x2D, 0x0E, 0x6B, 0x48, 0xA1, 0x82, 0xE7, 0xC4, 0x16, 0x35, 0x50, 0x73, 0x9A, 0xB9, 0xDC, 0xFF,
+)
+INV_MIX_BYTE = (
+    0x00, 0x23, 0x46, 0x65, 0x8C, 0xAF, 0xCA, 0xE9, 0x3B, 0x18, 0x7D, 0x5E, 0xB7, 0x94, 0xF1, 0xD2,
+    0x32, 0x11, 0x74, 0x57, 0xBE, 0x9D, 0xF8, 0xDB, 0x09, 0x2A, 0x4F, 0x6C, 0x85, 0xA6, 0xC3, 0xE0,
+    0x64, 0x47, 0x22, 0x01, 0xE8, 0xCB, 0xAE, 0x8D, 0x5F, 0x7C, 0x19, 0x3A, 0xD3, 0xF0, 0x95, 0xB6,
+    0x56, 0x75, 0x10, 0x33, 0xDA, 0xF9, 0x9C, 0xBF, 0x6D, 0x4E, 0x2B, 0x08, 0xE1, 0xC2, 0xA7, 0x84,
+    0xC8, 0xEB, 0x8E, 0xAD, 0x44, 0x67, 0x02, 0x21, 0xF3, 0xD0, 0xB5, 0x96, 0x7F, 0x5C, 0x39, 0x1A,
+    0xFA, 0xD9, 0xBC, 0x9F, 0x76, 0x55, 0x30, 0x13, 0xC1, 0xE2, 0x87, 0xA4, 0x4D, 0x6E, 0x0B, 0x28,
+    0xAC, 0x8F, 0xEA, 0xC9, 0x20, 0x03, 0x66, 0x45, 0x97, 0xB4, 0xD1, 0xF2, 0x1B, 0x38, 0x5D, 0x7E,
+    0x9E, 0xBD, 0xD8, 0xFB, 0x12, 0x31, 0x54, 0x77, 0xA5, 0x86, 0xE3, 0xC0, 0x29, 0x0A, 0x6F, 0x4C,
+    0xB3, 0x90, 0xF5, 0xD6, 0x3F, 0x1C, 0x79, 0x5A, 0x88, 0xAB, 0xCE, 0xED, 0x04, 0x27, 0x42, 0x61,
+    0x81, 0xA2, 0xC7, 0xE4, 0x0D, 0x2E, 0x4B, 0x68, 0xBA, 0x99, 0xFC, 0xDF, 0x36, 0x15, 0x70, 0x53,
+    0xD7, 0xF4, 0x91, 0xB2, 0x5B, 0x78, 0x1D, 0x3E, 0xEC, 0xCF, 0xAA, 0x89, 0x60, 0x43, 0x26, 0x05,
+    0xE5, 0xC6, 0xA3, 0x80, 0x69, 0x4A, 0x2F, 0x0C, 0xDE, 0xFD, 0x98, 0xBB, 0x52, 0x71, 0x14, 0x37,
+    0x7B, 0x58, 0x3D, 0x1E, 0xF7, 0xD4, 0xB1, 0x92, 0x40, 0x63, 0x06, 0x25, 0xCC, 0xEF, 0x8A, 0xA9,
+    0x49, 0x6A, 0x0F, 0x2C, 0xC5, 0xE6, 0x83, 0xA0, 0x72, 0x51, 0x34, 0x17, 0xFE, 0xDD, 0xB8, 0x9B,
+    0x1F, 0x3C, 0x59, 0x7A, 0x93, 0xB0, 0xD5, 0xF6, 0x24, 0x07, 0x62, 0x41, 0xA8, 0x8B, 0xEE, 0xCD,
+    0x2D, 0x0E, 0x6B, 0x48, 0xA1, 0x82, 0xE7, 0xC4, 0x16, 0x35, 0x50, 0x73, 0x9A, 0xB9, 0xDC, 0xFF,
+)
+ENC_HI = (
+    0x1FF1, 0x1F8C, 0x1F94, 0x1F23, 0x1F46, 0x1FD2, 0x1F5E, 0x1F3B, 0x1F65, 0x1F7D, 0x1FCA, 0x1FB7, 0x1FAF, 0x1F18, 0x1F00, 0x1FE9,
+    0xC8F1, 0xC88C, 0xC894, 0xC823, 0xC846, 0xC8D2, 0xC85E, 0xC83B, 0xC865, 0xC87D, 0xC8CA, 0xC8B7, 0xC8AF, 0xC818, 0xC800, 0xC8E9,
+    0x49F1, 0x498C, 0x4994, 0x4923, 0x4946, 0x49D2, 0x495E, 0x493B, 0x4965, 0x497D, 0x49CA, 0x49B7, 0x49AF, 0x4918, 0x4900, 0x49E9,
+    0x32F1, 0x328C, 0x3294, 0x3223, 0x3246, 0x32D2, 0x325E, 0x323B, 0x3265, 0x327D, 0x32CA, 0x32B7, 0x32AF, 0x3218, 0x3200, 0x32E9,
+    0x64F1, 0x648C, 0x6494, 0x6423, 0x6446, 0x64D2, 0x645E, 0x643B, 0x6465, 0x647D, 0x64CA, 0x64B7, 0x64AF, 0x6418, 0x6400, 0x64E9,
+    0x2DF1, 0x2D8C, 0x2D94, 0x2D23, 0x2D46, 0x2DD2, 0x2D5E, 0x2D3B, 0x2D65, 0x2D7D, 0x2DCA, 0x2DB7, 0x2DAF, 0x2D18, 0x2D00, 0x2DE9,
+    0xE5F1, 0xE58C, 0xE594, 0xE523, 0xE546, 0xE5D2, 0xE55E, 0xE53B, 0xE565, 0xE57D, 0xE5CA, 0xE5B7, 0xE5AF, 0xE518, 0xE500, 0xE5E9,
+    0xB3F1, 0xB38C, 0xB394, 0xB323, 0xB346, 0xB3D2, 0xB35E, 0xB33B, 0xB365, 0xB37D, 0xB3CA, 0xB3B7, 0xB3AF, 0xB318, 0xB300, 0xB3E9,
+    0x56F1, 0x568C, 0x5694, 0x5623, 0x5646, 0x56D2, 0x565E, 0x563B, 0x5665, 0x567D, 0x56CA, 0x56B7, 0x56AF, 0x5618, 0x5600, 0x56E9,
+    0xD7F1, 0xD78C, 0xD794, 0xD723, 0xD746, 0xD7D2, 0xD75E, 0xD73B, 0xD765, 0xD77D, 0xD7CA, 0xD7B7, 0xD7AF, 0xD718, 0xD700, 0xD7E9,
+    0xACF1, 0xAC8C, 0xAC94, 0xAC23, 0xAC46, 0xACD2, 0xAC5E, 0xAC3B, 0xAC65, 0xAC7D, 0xACCA, 0xACB7, 0xACAF, 0xAC18, 0xAC00, 0xACE9,
+    0x7BF1, 0x7B8C, 0x7B94, 0x7B23, 0x7B46, 0x7BD2, 0x7B5E, 0x7B3B, 0x7B65, 0x7B7D, 0x7BCA, 0x7BB7, 0x7BAF, 0x7B18, 0x7B00, 0x7BE9,
+    0xFAF1, 0xFA8C, 0xFA94, 0xFA23, 0xFA46, 0xFAD2, 0xFA5E, 0xFA3B, 0xFA65, 0xFA7D, 0xFACA, 0xFAB7, 0xFAAF, 0xFA18, 0xFA00, 0xFAE9,
+    0x81F1, 0x818C, 0x8194, 0x8123, 0x8146, 0x81D2, 0x815E, 0x813B, 0x8165, 0x817D, 0x81CA, 0x81B7, 0x81AF, 0x8118, 0x8100, 0x81E9,
+    0x00F1, 0x008C, 0x0094, 0x0023, 0x0046, 0x00D2, 0x005E, 0x003B, 0x0065, 0x007D, 0x00CA, 0x00B7, 0x00AF, 0x0018, 0x0000, 0x00E9,
+    0x9EF1, 0x9E8C, 0x9E94, 0x9E23, 0x9E46, 0x9ED2, 0x9E5E, 0x9E3B, 0x9E65, 0x9E7D, 0x9ECA, 0x9EB7, 0x9EAF, 0x9E18, 0x9E00, 0x9EE9,
+)
+ENC_LO = (
+    0xF11F, 0x8C1F, 0x941F, 0x231F, 0x461F, 0xD21F, 0x5E1F, 0x3B1F, 0x651F, 0x7D1F, 0xCA1F, 0xB71F, 0xAF1F, 0x181F, 0x001F, 0xE91F,
+    0xF1C8, 0x8CC8, 0x94C8, 0x23C8, 0x46C8, 0xD2C8, 0x5EC8, 0x3BC8, 0x65C8, 0x7DC8, 0xCAC8, 0xB7C8, 0xAFC8, 0x18C8, 0x00C8, 0xE9C8,
+    0xF149, 0x8C49, 0x9449, 0x2349, 0x4649, 0xD249, 0x5E49, 0x3B49, 0x6549, 0x7D49, 0xCA49, 0xB749, 0xAF49, 0x1849, 0x0049, 0xE949,
+    0xF132, 0x8C32, 0x9432, 0x2332, 0x4632, 0xD232, 0x5E32, 0x3B32, 0x6532, 0x7D32, 0xCA32, 0xB732, 0xAF32, 0x1832, 0x0032, 0xE932,
+    0xF164, 0x8C64, 0x9464, 0x2364, 0x4664, 0xD264, 0x5E64, 0x3B64, 0x6564, 0x7D64, 0xCA64, 0xB764, 0xAF64, 0x1864, 0x0064, 0xE964,
+    0xF12D, 0x8C2D, 0x942D, 0x232D, 0x462D, 0xD22D, 0x5E2D, 0x3B2D, 0x652D, 0x7D2D, 0xCA2D, 0xB72D, 0xAF2D, 0x182D, 0x002D, 0xE92D,
+    0xF1E5, 0x8CE5, 0x94E5, 0x23E5, 0x46E5, 0xD2E5, 0x5EE5, 0x3BE5, 0x65E5, 0x7DE5, 0xCAE5, 0xB7E5, 0xAFE5, 0x18E5, 0x00E5, 0xE9E5,
+    0xF1B3, 0x8CB3, 0x94B3, 0x23B3, 0x46B3, 0xD2B3, 0x5EB3, 0x3BB3, 0x65B3, 0x7DB3, 0xCAB3, 0xB7B3, 0xAFB3, 0x18B3, 0x00B3, 0xE9B3,
+    0xF156, 0x8C56, 0x9456, 0x2356, 0x4656, 0xD256, 0x5E56, 0x3B56, 0x6556, 0x7D56, 0xCA56, 0xB756, 0xAF56, 0x1856, 0x0056, 0xE956,
+    0xF1D7, 0x8CD7, 0x94D7, 0x23D7, 0x46D7, 0xD2D7, 0x5ED7, 0x3BD7, 0x65D7, 0x7DD7, 0xCAD7, 0xB7D7, 0xAFD7, 0x18D7, 0x00D7, 0xE9D7,
+    0xF1AC, 0x8CAC, 0x94AC, 0x23AC, 0x46AC, 0xD2AC, 0x5EAC, 0x3BAC, 0x65AC, 0x7DAC, 0xCAAC, 0xB7AC, 0xAFAC, 0x18AC, 0x00AC, 0xE9AC,
+    0xF17B, 0x8C7B, 0x947B, 0x237B, 0x467B, 0xD27B, 0x5E7B, 0x3B7B, 0x657B, 0x7D7B, 0xCA7B, 0xB77B, 0xAF7B, 0x187B, 0x007B, 0xE97B,
+    0xF1FA, 0x8CFA, 0x94FA, 0x23FA, 0x46FA, 0xD2FA, 0x5EFA, 0x3BFA, 0x65FA, 0x7DFA, 0xCAFA, 0xB7FA, 0xAFFA, 0x18FA, 0x00FA, 0xE9FA,
+    0xF181, 0x8C81, 0x9481, 0x2381, 0x4681, 0xD281, 0x5E81, 0x3B81, 0x6581, 0x7D81, 0xCA81, 0xB781, 0xAF81, 0x1881, 0x0081, 0xE981,
+    0xF100, 0x8C00, 0x9400, 0x2300, 0x4600, 0xD200, 0x5E00, 0x3B00, 0x6500, 0x7D00, 0xCA00, 0xB700, 0xAF00, 0x1800, 0x0000, 0xE900,
+    0xF19E, 0x8C9E, 0x949E, 0x239E, 0x469E, 0xD29E, 0x5E9E, 0x3B9E, 0x659E, 0x7D9E, 0xCA9E, 0xB79E, 0xAF9E, 0x189E, 0x009E, 0xE99E,
+)
+FIN_HI = (
+    0xE00E, 0xE004, 0xE00D, 0xE001, 0xE002, 0xE00F, 0xE00B, 0xE008, 0xE003, 0xE00A, 0xE006, 0xE00C, 0xE005, 0xE009, 0xE000, 0xE007,
+    0x400E, 0x4004, 0x400D, 0x4001, 0x4002, 0x400F, 0x400B, 0x4008, 0x4003, 0x400A, 0x4006, 0x400C, 0x4005, 0x4009, 0x4000, 0x4007,
+    0xD00E, 0xD004, 0xD00D, 0xD001, 0xD002, 0xD00F, 0xD00B, 0xD008, 0xD003, 0xD00A, 0xD006, 0xD00C, 0xD005, 0xD009, 0xD000, 0xD007,
+    0x100E, 0x1004, 0x100D, 0x1001, 0x1002, 0x100F, 0x100B, 0x1008, 0x1003, 0x100A, 0x1006, 0x100C, 0x1005, 0x1009, 0x1000, 0x1007,
+    0x200E, 0x2004, 0x200D, 0x2001, 0x2002, 0x200F, 0x200B, 0x2008, 0x2003, 0x200A, 0x2006, 0x200C, 0x2005, 0x2009, 0x2000, 0x2007,
+    0xF00E, 0xF004, 0xF00D, 0xF001, 0xF002, 0xF00F, 0xF00B, 0xF008, 0xF003, 0xF00A, 0xF006, 0xF00C, 0xF005, 0xF009, 0xF000, 0xF007,
+    0xB00E, 0xB004, 0xB00D, 0xB001, 0xB002, 0xB00F, 0xB00B, 0xB008, 0xB003, 0xB00A, 0xB006, 0xB00C, 0xB005, 0xB009, 0xB000, 0xB007,
+    0x800E, 0x8004, 0x800D, 0x8001, 0x8002, 0x800F, 0x800B, 0x8008, 0x8003, 0x800A, 0x8006, 0x800C, 0x8005, 0x8009, 0x8000, 0x8007,
+    0x300E, 0x3004, 0x300D, 0x3001, 0x3002, 0x300F, 0x300B, 0x3008, 0x3003, 0x300A, 0x3006, 0x300C, 0x3005, 0x3009, 0x3000, 0x3007,
+    0xA00E, 0xA004, 0xA00D, 0xA001, 0xA002, 0xA00F, 0xA00B, 0xA008, 0xA003, 0xA00A, 0xA006, 0xA00C, 0xA005, 0xA009, 0xA000, 0xA007,
+    0x600E, 0x6004, 0x600D, 0x6001, 0x6002, 0x600F, 0x600B, 0x6008, 0x6003, 0x600A, 0x6006, 0x600C, 0x6005, 0x6009, 0x6000, 0x6007,
+    0xC00E, 0xC004, 0xC00D, 0xC001, 0xC002, 0xC00F, 0xC00B, 0xC008, 0xC003, 0xC00A, 0xC006, 0xC00C, 0xC005, 0xC009, 0xC000, 0xC007,
+    0x500E, 0x5004, 0x500D, 0x5001, 0x5002, 0x500F, 0x500B, 0x5008, 0x5003, 0x500A, 0x5006, 0x500C, 0x5005, 0x5009, 0x5000, 0x5007,
+    0x900E, 0x9004, 0x900D, 0x9001, 0x9002, 0x900F, 0x900B, 0x9008, 0x9003, 0x900A, 0x9006, 0x900C, 0x9005, 0x9009, 0x9000, 0x9007,
+    0x000E, 0x0004, 0x000D, 0x0001, 0x0002, 0x000F, 0x000B, 0x0008, 0x0003, 0x000A, 0x0006, 0x000C, 0x0005, 0x0009, 0x0000, 0x0007,
+    0x700E, 0x7004, 0x700D, 0x7001, 0x7002, 0x700F, 0x700B, 0x7008, 0x7003, 0x700A, 0x7006, 0x700C, 0x7005, 0x7009, 0x7000, 0x7007,
+)
+FIN_LO = (
+    0x0EE0, 0x04E0, 0x0DE0, 0x01E0, 0x02E0, 0x0FE0, 0x0BE0, 0x08E0, 0x03E0, 0x0AE0, 0x06E0, 0x0CE0, 0x05E0, 0x09E0, 0x00E0, 0x07E0,
+    0x0E40, 0x0440, 0x0D40, 0x0140, 0x0240, 0x0F40, 0x0B40, 0x0840, 0x0340, 0x0A40, 0x0640, 0x0C40, 0x0540, 0x0940, 0x0040, 0x0740,
+    0x0ED0, 0x04D0, 0x0DD0, 0x01D0, 0x02D0, 0x0FD0, 0x0BD0, 0x08D0, 0x03D0, 0x0AD0, 0x06D0, 0x0CD0, 0x05D0, 0x09D0, 0x00D0, 0x07D0,
+    0x0E10, 0x0410, 0x0D10, 0x0110, 0x0210, 0x0F10, 0x0B10, 0x0810, 0x0310, 0x0A10, 0x0610, 0x0C10, 0x0510, 0x0910, 0x0010, 0x0710,
+    0x0E20, 0x0420, 0x0D20, 0x0120, 0x0220, 0x0F20, 0x0B20, 0x0820, 0x0320, 0x0A20, 0x0620, 0x0C20, 0x0520, 0x0920, 0x0020, 0x0720,
+    0x0EF0, 0x04F0, 0x0DF0, 0x01F0, 0x02F0, 0x0FF0, 0x0BF0, 0x08F0, 0x03F0, 0x0AF0, 0x06F0, 0x0CF0, 0x05F0, 0x09F0, 0x00F0, 0x07F0,
+    0x0EB0, 0x04B0, 0x0DB0, 0x01B0, 0x02B0, 0x0FB0, 0x0BB0, 0x08B0, 0x03B0, 0x0AB0, 0x06B0, 0x0CB0, 0x05B0, 0x09B0, 0x00B0, 0x07B0,
+    0x0E80, 0x0480, 0x0D80, 0x0180, 0x0280, 0x0F80, 0x0B80, 0x0880, 0x0380, 0x0A80, 0x0680, 0x0C80, 0x0580, 0x0980, 0x0080, 0x0780,
+    0x0E30, 0x0430, 0x0D30, 0x0130, 0x0230, 0x0F30, 0x0B30, 0x0830, 0x0330, 0x0A30, 0x0630, 0x0C30, 0x0530, 0x0930, 0x0030, 0x0730,
+    0x0EA0, 0x04A0, 0x0DA0, 0x01A0, 0x02A0, 0x0FA0, 0x0BA0, 0x08A0, 0x03A0, 0x0AA0, 0x06A0, 0x0CA0, 0x05A0, 0x09A0, 0x00A0, 0x07A0,
+    0x0E60, 0x0460, 0x0D60, 0x0160, 0x0260, 0x0F60, 0x0B60, 0x0860, 0x0360, 0x0A60, 0x0660, 0x0C60, 0x0560, 0x0960, 0x0060, 0x0760,
+    0x0EC0, 0x04C0, 0x0DC0, 0x01C0, 0x02C0, 0x0FC0, 0x0BC0, 0x08C0, 0x03C0, 0x0AC0, 0x06C0, 0x0CC0, 0x05C0, 0x09C0, 0x00C0, 0x07C0,
+    0x0E50, 0x0450, 0x0D50, 0x0150, 0x0250, 0x0F50, 0x0B50, 0x0850, 0x0350, 0x0A50, 0x0650, 0x0C50, 0x0550, 0x0950, 0x0050, 0x0750,
+    0x0E90, 0x0490, 0x0D90, 0x0190, 0x0290, 0x0F90, 0x0B90, 0x0890, 0x0390, 0x0A90, 0x0690, 0x0C90, 0x0590, 0x0990, 0x0090, 0x0790,
+    0x0E00, 0x0400, 0x0D00, 0x0100, 0x0200, 0x0F00, 0x0B00, 0x0800, 0x0300, 0x0A00, 0x0600, 0x0C00, 0x0500, 0x0900, 0x0000, 0x0700,
+    0x0E70, 0x0470, 0x0D70, 0x0170, 0x0270, 0x0F70, 0x0B70, 0x0870, 0x0370, 0x0A70, 0x0670, 0x0C70, 0x0570, 0x0970, 0x0070, 0x0770,
+)
+DEC_HI = (
+    0xE00E, 0x4008, 0x100A, 0xA00C, 0x700B, 0x9005, 0xB009, 0x000D, 0x8006, 0x3007, 0xF002, 0xC000, 0x600F, 0xD001, 0x5003, 0x2004,
+    0x8004, 0x3003, 0xF001, 0xC00F, 0x6000, 0xD002, 0x5007, 0x2006, 0xE00D, 0x4009, 0x1005, 0xA00B, 0x700C, 0x900A, 0xB008, 0x000E,
+    0xA001, 0x100F, 0x4004, 0xE003, 0x0007, 0xB006, 0x9000, 0x7002, 0xC005, 0xF00B, 0x300D, 0x8009, 0x2008, 0x500E, 0xD00C, 0x600A,
+    0xC00A, 0xF00C, 0x300E, 0x8008, 0x2009, 0x500D, 0xD00B, 0x6005, 0xA002, 0x1000, 0x4006, 0xE007, 0x0003, 0xB004, 0x900F, 0x7001,
+    0xB007, 0x0006, 0x7000, 0x9002, 0x1001, 0xA00F, 0xE004, 0x4003, 0x5008, 0x200E, 0x600C, 0xD00A, 0xF005, 0xC00B, 0x800D, 0x3009,
+    0x5009, 0x200D, 0x600B, 0xD005, 0xF00A, 0xC00C, 0x800E, 0x3008, 0xB003, 0x0004, 0x700F, 0x9001, 0x1002, 0xA000, 0xE006, 0x4007,
+    0x900B, 0x7005, 0x0009, 0xB00D, 0x400E, 0xE008, 0xA00A, 0x100C, 0xD00F, 0x6001, 0x2003, 0x5004, 0x3006, 0x8007, 0xC002, 0xF000,
+    0xD000, 0x6002, 0x2007, 0x5006, 0x3004, 0x8003, 0xC001, 0xF00F, 0x900C, 0x700A, 0x0008, 0xB00E, 0x400D, 0xE009, 0xA005, 0x100B,
+    0x6008, 0xD00E, 0x500C, 0x200A, 0x8005, 0x300B, 0xF00D, 0xC009, 0x7007, 0x9006, 0xB000, 0x0002, 0xE001, 0x400F, 0x1004, 0xA003,
+    0x7003, 0x9004, 0xB00F, 0x0001, 0xE002, 0x4000, 0x1006, 0xA007, 0x6009, 0xD00D, 0x500B, 0x2005, 0x800A, 0x300C, 0xF00E, 0xC008,
+    0x200F, 0x5001, 0xD003, 0x6004, 0xC006, 0xF007, 0x3002, 0x8000, 0x000B, 0xB005, 0x9009, 0x700D, 0xA00E, 0x1008, 0x400A, 0xE00C,
+    0x000C, 0xB00A, 0x9008, 0x700E, 0xA00D, 0x1009, 0x4005, 0xE00B, 0x2000, 0x5002, 0xD007, 0x6006, 0xC004, 0xF003, 0x3001, 0x800F,
+    0xF006, 0xC007, 0x8002, 0x3000, 0x500F, 0x2001, 0x6003, 0xD004, 0x100E, 0xA008, 0xE00A, 0x400C, 0xB00B, 0x0005, 0x7009, 0x900D,
+    0x100D, 0xA009, 0xE005, 0x400B, 0xB00C, 0x000A, 0x7008, 0x900E, 0xF004, 0xC003, 0x8001, 0x300F, 0x5000, 0x2002, 0x6007, 0xD006,
+    0x3005, 0x800B, 0xC00D, 0xF009, 0xD008, 0x600E, 0x200C, 0x500A, 0x4001, 0xE00F, 0xA004, 0x1003, 0x9007, 0x7006, 0x0000, 0xB002,
+    0x4002, 0xE000, 0xA006, 0x1007, 0x9003, 0x7004, 0x000F, 0xB001, 0x300A, 0x800C, 0xC00E, 0xF008, 0xD009, 0x600D, 0x200B, 0x5005,
+)
+DEC_LO = (
+    0x0EE0, 0x0840, 0x0A10, 0x0CA0, 0x0B70, 0x0590, 0x09B0, 0x0D00, 0x0680, 0x0730, 0x02F0, 0x00C0, 0x0F60, 0x01D0, 0x0350, 0x0420,
+    0x0480, 0x0330, 0x01F0, 0x0FC0, 0x0060, 0x02D0, 0x0750, 0x0620, 0x0DE0, 0x0940, 0x0510, 0x0BA0, 0x0C70, 0x0A90, 0x08B0, 0x0E00,
+    0x01A0, 0x0F10, 0x0440, 0x03E0, 0x0700, 0x06B0, 0x0090, 0x0270, 0x05C0, 0x0BF0, 0x0D30, 0x0980, 0x0820, 0x0E50, 0x0CD0, 0x0A60,
+    0x0AC0, 0x0CF0, 0x0E30, 0x0880, 0x0920, 0x0D50, 0x0BD0, 0x0560, 0x02A0, 0x0010, 0x0640, 0x07E0, 0x0300, 0x04B0, 0x0F90, 0x0170,
+    0x07B0, 0x0600, 0x0070, 0x0290, 0x0110, 0x0FA0, 0x04E0, 0x0340, 0x0850, 0x0E20, 0x0C60, 0x0AD0, 0x05F0, 0x0BC0, 0x0D80, 0x0930,
+    0x0950, 0x0D20, 0x0B60, 0x05D0, 0x0AF0, 0x0CC0, 0x0E80, 0x0830, 0x03B0, 0x0400, 0x0F70, 0x0190, 0x0210, 0x00A0, 0x06E0, 0x0740,
+    0x0B90, 0x0570, 0x0900, 0x0DB0, 0x0E40, 0x08E0, 0x0AA0, 0x0C10, 0x0FD0, 0x0160, 0x0320, 0x0450, 0x0630, 0x0780, 0x02C0, 0x00F0,
+    0x00D0, 0x0260, 0x0720, 0x0650, 0x0430, 0x0380, 0x01C0, 0x0FF0, 0x0C90, 0x0A70, 0x0800, 0x0EB0, 0x0D40, 0x09E0, 0x05A0, 0x0B10,
+    0x0860, 0x0ED0, 0x0C50, 0x0A20, 0x0580, 0x0B30, 0x0DF0, 0x09C0, 0x0770, 0x0690, 0x00B0, 0x0200, 0x01E0, 0x0F40, 0x0410, 0x03A0,
+    0x0370, 0x0490, 0x0FB0, 0x0100, 0x02E0, 0x0040, 0x0610, 0x07A0, 0x0960, 0x0DD0, 0x0B50, 0x0520, 0x0A80, 0x0C30, 0x0EF0, 0x08C0,
+    0x0F20, 0x0150, 0x03D0, 0x0460, 0x06C0, 0x07F0, 0x0230, 0x0080, 0x0B00, 0x05B0, 0x0990, 0x0D70, 0x0EA0, 0x0810, 0x0A40, 0x0CE0,
+    0x0C00, 0x0AB0, 0x0890, 0x0E70, 0x0DA0, 0x0910, 0x0540, 0x0BE0, 0x0020, 0x0250, 0x07D0, 0x0660, 0x04C0, 0x03F0, 0x0130, 0x0F80,
+    0x06F0, 0x07C0, 0x0280, 0x0030, 0x0F50, 0x0120, 0x0360, 0x04D0, 0x0E10, 0x08A0, 0x0AE0, 0x0C40, 0x0BB0, 0x0500, 0x0970, 0x0D90,
+    0x0D10, 0x09A0, 0x05E0, 0x0B40, 0x0CB0, 0x0A00, 0x0870, 0x0E90, 0x04F0, 0x03C0, 0x0180, 0x0F30, 0x0050, 0x0220, 0x0760, 0x06D0,
+    0x0530, 0x0B80, 0x0DC0, 0x09F0, 0x08D0, 0x0E60, 0x0C20, 0x0A50, 0x0140, 0x0FE0, 0x04A0, 0x0310, 0x0790, 0x0670, 0x0000, 0x02B0,
+    0x0240, 0x00E0, 0x06A0, 0x0710, 0x0390, 0x0470, 0x0F00, 0x01B0, 0x0A30, 0x0C80, 0x0EC0, 0x08F0, 0x09D0, 0x0D60, 0x0B20, 0x0550,
+)
+DFIN_HI = (
+    0xE00E, 0xE003, 0xE004, 0xE008, 0xE001, 0xE00C, 0xE00A, 0xE00F, 0xE007, 0xE00D, 0xE009, 0xE006, 0xE00B, 0xE002, 0xE000, 0xE005,
+    0x300E, 0x3003, 0x3004, 0x3008, 0x3001, 0x300C, 0x300A, 0x300F, 0x3007, 0x300D, 0x3009, 0x3006, 0x300B, 0x3002, 0x3000, 0x3005,
+    0x400E, 0x4003, 0x4004, 0x4008, 0x4001, 0x400C, 0x400A, 0x400F, 0x4007, 0x400D, 0x4009, 0x4006, 0x400B, 0x4002, 0x4000, 0x4005,
+    0x800E, 0x8003, 0x8004, 0x8008, 0x8001, 0x800C, 0x800A, 0x800F, 0x8007, 0x800D, 0x8009, 0x8006, 0x800B, 0x8002, 0x8000, 0x8005,
+    0x100E, 0x1003, 0x1004, 0x1008, 0x1001, 0x100C, 0x100A, 0x100F, 0x1007, 0x100D, 0x1009, 0x1006, 0x100B, 0x1002, 0x1000, 0x1005,
+    0xC00E, 0xC003, 0xC004, 0xC008, 0xC001, 0xC00C, 0xC00A, 0xC00F, 0xC007, 0xC00D, 0xC009, 0xC006, 0xC00B, 0xC002, 0xC000, 0xC005,
+    0xA00E, 0xA003, 0xA004, 0xA008, 0xA001, 0xA00C, 0xA00A, 0xA00F, 0xA007, 0xA00D, 0xA009, 0xA006, 0xA00B, 0xA002, 0xA000, 0xA005,
+    0xF00E, 0xF003, 0xF004, 0xF008, 0xF001, 0xF00C, 0xF00A, 0xF00F, 0xF007, 0xF00D, 0xF009, 0xF006, 0xF00B, 0xF002, 0xF000, 0xF005,
+    0x700E, 0x7003, 0x7004, 0x7008, 0x7001, 0x700C, 0x700A, 0x700F, 0x7007, 0x700D, 0x7009, 0x7006, 0x700B, 0x7002, 0x7000, 0x7005,
+    0xD00E, 0xD003, 0xD004, 0xD008, 0xD001, 0xD00C, 0xD00A, 0xD00F, 0xD007, 0xD00D, 0xD009, 0xD006, 0xD00B, 0xD002, 0xD000, 0xD005,
+    0x900E, 0x9003, 0x9004, 0x9008, 0x9001, 0x900C, 0x900A, 0x900F, 0x9007, 0x900D, 0x9009, 0x9006, 0x900B, 0x9002, 0x9000, 0x9005,
+    0x600E, 0x6003, 0x6004, 0x6008, 0x6001, 0x600C, 0x600A, 0x600F, 0x6007, 0x600D, 0x6009, 0x6006, 0x600B, 0x6002, 0x6000, 0x6005,
+    0xB00E, 0xB003, 0xB004, 0xB008, 0xB001, 0xB00C, 0xB00A, 0xB00F, 0xB007, 0xB00D, 0xB009, 0xB006, 0xB00B, 0xB002, 0xB000, 0xB005,
+    0x200E, 0x2003, 0x2004, 0x2008, 0x2001, 0x200C, 0x200A, 0x200F, 0x2007, 0x200D, 0x2009, 0x2006, 0x200B, 0x2002, 0x2000, 0x2005,
+    0x000E, 0x0003, 0x0004, 0x0008, 0x0001, 0x000C, 0x000A, 0x000F, 0x0007, 0x000D, 0x0009, 0x0006, 0x000B, 0x0002, 0x0000, 0x0005,
+    0x500E, 0x5003, 0x5004, 0x5008, 0x5001, 0x500C, 0x500A, 0x500F, 0x5007, 0x500D, 0x5009, 0x5006, 0x500B, 0x5002, 0x5000, 0x5005,
+)
+DFIN_LO = (
+    0x0EE0, 0x03E0, 0x04E0, 0x08E0, 0x01E0, 0x0CE0, 0x0AE0, 0x0FE0, 0x07E0, 0x0DE0, 0x09E0, 0x06E0, 0x0BE0, 0x02E0, 0x00E0, 0x05E0,
+    0x0E30, 0x0330, 0x0430, 0x0830, 0x0130, 0x0C30, 0x0A30, 0x0F30, 0x0730, 0x0D30, 0x0930, 0x0630, 0x0B30, 0x0230, 0x0030, 0x0530,
+    0x0E40, 0x0340, 0x0440, 0x0840, 0x0140, 0x0C40, 0x0A40, 0x0F40, 0x0740, 0x0D40, 0x0940, 0x0640, 0x0B40, 0x0240, 0x0040, 0x0540,
+    0x0E80, 0x0380, 0x0480, 0x0880, 0x0180, 0x0C80, 0x0A80, 0x0F80, 0x0780, 0x0D80, 0x0980, 0x0680, 0x0B80, 0x0280, 0x0080, 0x0580,
+    0x0E10, 0x0310, 0x0410, 0x0810, 0x0110, 0x0C10, 0x0A10, 0x0F10, 0x0710, 0x0D10, 0x0910, 0x0610, 0x0B10, 0x0210, 0x0010, 0x0510,
+    0x0EC0, 0x03C0, 0x04C0, 0x08C0, 0x01C0, 0x0CC0, 0x0AC0, 0x0FC0, 0x07C0, 0x0DC0, 0x09C0, 0x06C0, 0x0BC0, 0x02C0, 0x00C0, 0x05C0,
+    0x0EA0, 0x03A0, 0x04A0, 0x08A0, 0x01A0, 0x0CA0, 0x0AA0, 0x0FA0, 0x07A0, 0x0DA0, 0x09A0, 0x06A0, 0x0BA0, 0x02A0, 0x00A0, 0x05A0,
+    0x0EF0, 0x03F0, 0x04F0, 0x08F0, 0x01F0, 0x0CF0, 0x0AF0, 0x0FF0, 0x07F0, 0x0DF0, 0x09F0, 0x06F0, 0x0BF0, 0x02F0, 0x00F0, 0x05F0,
+    0x0E70, 0x0370, 0x0470, 0x0870, 0x0170, 0x0C70, 0x0A70, 0x0F70, 0x0770, 0x0D70, 0x0970, 0x0670, 0x0B70, 0x0270, 0x0070, 0x0570,
+    0x0ED0, 0x03D0, 0x04D0, 0x08D0, 0x01D0, 0x0CD0, 0x0AD0, 0x0FD0, 0x07D0, 0x0DD0, 0x09D0, 0x06D0, 0x0BD0, 0x02D0, 0x00D0, 0x05D0,
+    0x0E90, 0x0390, 0x0490, 0x0890, 0x0190, 0x0C90, 0x0A90, 0x0F90, 0x0790, 0x0D90, 0x0990, 0x0690, 0x0B90, 0x0290, 0x0090, 0x0590,
+    0x0E60, 0x0360, 0x0460, 0x0860, 0x0160, 0x0C60, 0x0A60, 0x0F60, 0x0760, 0x0D60, 0x0960, 0x0660, 0x0B60, 0x0260, 0x0060, 0x0560,
+    0x0EB0, 0x03B0, 0x04B0, 0x08B0, 0x01B0, 0x0CB0, 0x0AB0, 0x0FB0, 0x07B0, 0x0DB0, 0x09B0, 0x06B0, 0x0BB0, 0x02B0, 0x00B0, 0x05B0,
+    0x0E20, 0x0320, 0x0420, 0x0820, 0x0120, 0x0C20, 0x0A20, 0x0F20, 0x0720, 0x0D20, 0x0920, 0x0620, 0x0B20, 0x0220, 0x0020, 0x0520,
+    0x0E00, 0x0300, 0x0400, 0x0800, 0x0100, 0x0C00, 0x0A00, 0x0F00, 0x0700, 0x0D00, 0x0900, 0x0600, 0x0B00, 0x0200, 0x0000, 0x0500,
+    0x0E50, 0x0350, 0x0450, 0x0850, 0x0150, 0x0C50, 0x0A50, 0x0F50, 0x0750, 0x0D50, 0x0950, 0x0650, 0x0B50, 0x0250, 0x0050, 0x0550,
+)
+
+if __name__ == "__main__":
+    # Regenerasi file ini dari implementasi referensi di encrypt_decrypt.py
+    from encrypt_decrypt import MiniAESCorePurePython
+
+    core = MiniAESCorePurePython()
+    core._compile_tables() # Paksa hitung ulang (abaikan konstanta yang ada)
+    tables = {
+        "SUB_BYTE": core._sub_byte, "INV_SUB_BYTE": core._inv_sub_byte,
+        "MIX_BYTE": core._mix_byte, "INV_MIX_BYTE": core._inv_mix_byte,
+        "ENC_HI": core._enc_hi, "ENC_LO": core._enc_lo,
+        "FIN_HI": core._fin_hi, "FIN_LO": core._fin_lo,
+        "DEC_HI": core._dec_hi, "DEC_LO": core._dec_lo,
+        "DFIN_HI": core._dfin_hi, "DFIN_LO": core._dfin_lo,
+    }
+    lines = []
+    for name, values in tables.items():
+        width = 2 if name.endswith("_BYTE") else 4 # Tabel per byte vs tabel state 16-bit
+        lines.append(f"{name} = (")
+        for i in range(0, len(values), 16):
+            lines.append("    " + ", ".join(f"0x{v:0{width}X}" for v in values[i:i + 16]) + ",")
+        lines.append(")")
+    with open(__file__, encoding="utf-8") as f:
+        source = f.read()
+    header, _, rest = source.partition("# @@TABLES@@\n")
+    footer = rest[rest.index('if __name__ == "__main__":'):]
+    with open(__file__, "w", encoding="utf-8") as f:
+        f.write(header + "# @@TABLES@@\n" + "\n".join(lines) + "\n\n" + footer)
+    print(f"Tabel ditulis ulang ke {__file__}")
@@ -0,0 +1,194 @@
+"""
+Pipeline File Mini-AES (baca, cipher, tulis berjalan bersamaan)
+Fitur:
+1. Tiga tahap: thread pembaca, tahap cipher (thread pemanggil), thread penulis
+2. Tahap-tahap dihubungkan antrean berbatas; buffer dipakai ulang (tanpa alokasi per potongan)
+3. Baca/tulis file melepas GIL, sehingga I/O berjalan saat tahap cipher menghitung
+
+Waktu total mendekati max(I/O, komputasi) alih-alih jumlah keduanya. Paling terasa pada
+penyimpanan lambat (jaringan); pada disk lokal yang di-cache, komputasi tetap dominan.
+
+Buffer berupa array('H') berukuran tetap: file dibaca langsung ke memorinya dengan
+`readinto`, dan tahap cipher mengubah blok 16-bit di tempat.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from array import array
+from queue import Queue
+
+# ---- Konstanta ----
+CHUNK_SIZE = 256 * 1024  # Ukuran satu buffer (byte, harus genap)
+DEPTH = 4                # Jumlah buffer yang berputar di pipeline
+_SWAP = sys.byteorder == 'little' # Blok disimpan big-endian (urutan hex state)
+
+# ---- Transformasi per potongan ----
+# Setiap transformasi menerima (blocks, count) dan mengubah blocks[:count] di tempat.
+def ecb_transform(cipher):
+    """Transformasi ECB dari fungsi blok int -> int (enkripsi atau dekripsi)."""
+    def transform(blocks, count):
+        for j in range(count):
+            blocks[j] = cipher(blocks[j])
+    return transform
+
+def cbc_encrypt_transform(encrypt, iv):
+    """Transformasi enkripsi CBC; rantai (blok sebelumnya) dibawa antar potongan."""
+    prev = iv
+    def transform(blocks, count):
+        nonlocal prev
+        p = prev
+        for j in range(count):
+            p = encrypt(blocks[j] ^ p)
+            blocks[j] = p
+        prev = p
+    return transform
+
+def cbc_decrypt_transform(decrypt, iv):
+    """Transformasi dekripsi CBC; rantai (ciphertext sebelumnya) dibawa antar potongan."""
+    prev = iv
+    def transform(blocks, count):
+        nonlocal prev
+        p = prev
+        for j in range(count):
+            c = blocks[j]
+            blocks[j] = decrypt(c) ^ p
+            p = c
+        prev = p
+    return transform
+
+# ---- Engine ----
+class FilePipeline:
+    """
+    Engine file tiga tahap dengan buffer yang dipakai ulang.
+
+    Alur buffer: free -> (pembaca) -> filled -> (cipher) -> written -> (penulis) -> free.
+    Jumlah buffer tetap (`depth`), sehingga antrean otomatis berbatas dan memori konstan.
+    """
+    def __init__(self, transform, chunk_size=CHUNK_SIZE, depth=DEPTH, pad=True):
+        if chunk_size <= 0 or chunk_size % 2:
+            raise ValueError("Ukuran buffer harus bilangan genap positif.")
+        if depth < 2:
+            raise ValueError("Pipeline membutuhkan minimal 2 buffer.")
+        self.transform = transform
+        self.chunk_size = chunk_size
+        self.depth = depth
+        self.pad = pad # Enkripsi: byte terakhir yang ganjil dipad nol; dekripsi: ditolak
+
+    def _reader(self, fin, free, filled, stop):
+        """Thread pembaca: mengisi buffer kosong dari file sampai EOF."""
+        try:
+            while True:
+                buf = free.get()
+                if stop.is_set():
+                    break
+                view = memoryview(buf).cast('B')
+                n = 0
+                # Baca sampai buffer penuh: readinto boleh mengembalikan kurang (mis. pipe/jaringan)
+                while n < self.chunk_size:
+                    got = fin.readinto(view[n:])
+                    if not got:
+                        break
+                    n += got
+                if n == 0:
+                    break
+                if n % 2:
+                    if not self.pad:
+                        raise ValueError("Panjang ciphertext harus kelipatan 2 byte (blok 16-bit).")
+                    view[n] = 0 # Padding nol, sama seperti mode ECB/CBC biasa
+                    n += 1
+                if _SWAP:
+                    buf.byteswap()
+                filled.put((buf, n))
+                if n < self.chunk_size:
+                    break # Potongan terakhir
+            filled.put(None)
+        except BaseException as e:
+            filled.put(e)
+
+    def _writer(self, fout, written, free, errors):
+        """Thread penulis: menulis buffer yang sudah diproses lalu mengembalikannya ke free."""
+        while True:
+            item = written.get()
+            if item is None:
+                break
+            buf, n = item
+            if not errors:
+                try:
+                    if _SWAP:
+                        buf.byteswap()
+                    fout.write(memoryview(buf).cast('B')[:n])
+                except BaseException as e:
+                    errors.append(e) # Tetap kuras antrean agar tahap lain tidak macet
+            free.put(buf)
+
+    def run(self, input_file, output_file):
+        """Memproses `input_file` ke `output_file`. Mengembalikan jumlah byte yang ditulis."""
+        with open(input_file, 'rb') as fin, open(output_file, 'wb') as fout:
+            return self.run_streams(fin, fout)
+
+    def run_streams(self, fin, fout):
+        """Seperti `run`, untuk objek file yang sudah terbuka (fin mendukung readinto)."""
+        free = Queue()
+        filled = Queue()
+        written = Queue()
+        for _ in range(self.depth):
+            free.put(array('H', bytes(self.chunk_size)))
+        stop = threading.Event()
+        errors = []
+        total = 0
+        reader = threading.Thread(target=self._reader, args=(fin, free, filled, stop), daemon=True)
+        writer = threading.Thread(target=self._writer, args=(fout, written, free, errors), daemon=True)
+        reader.start()
+        writer.start()
+        try:
+            # Tahap cipher di thread pemanggil (komputasi Python memegang GIL)
+            transform = self.transform
+            while not errors:
+                item = filled.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                buf, n = item
+                transform(buf, n // 2)
+                written.put((buf, n))
+                total += n
+        finally:
+            # Hentikan pembaca (jika belum selesai) dan bangunkan bila sedang menunggu buffer
+            stop.set()
+            free.put(None)
+            written.put(None)
+            writer.join()
+            reader.join()
+        if errors:
+            raise errors[0]
+        return total
+
+def process_file(input_file, output_file, transform, pad=True, chunk_size=CHUNK_SIZE, depth=DEPTH):
+    """
+    Menjalankan pipeline untuk satu file. Mengembalikan jumlah byte yang ditulis.
+
+    Hasil ditulis ke file sementara di direktori output lalu di-rename ke `output_file`
+    hanya jika berhasil: output lama tidak tersentuh saat gagal, dan output boleh sama
+    dengan input (input dibaca utuh sebelum diganti). Target yang bukan file biasa
+    (mis. /dev/stdout) ditulis langsung.
+    """
+    pipeline = FilePipeline(transform, chunk_size, depth, pad)
+    # Validasi ukuran sebelum output disentuh
+    if not pad and os.path.getsize(input_file) % 2:
+        raise ValueError("Panjang ciphertext harus kelipatan 2 byte (blok 16-bit).")
+    if os.path.exists(output_file) and not os.path.isfile(output_file):
+        return pipeline.run(input_file, output_file)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output_file)), prefix='.pipeline-')
+    try:
+        with open(input_file, 'rb') as fin, os.fdopen(fd, 'wb') as fout:
+            total = pipeline.run_streams(fin, fout)
+        os.replace(tmp, output_file)
+    except BaseException:
+        # Hanya file sementara milik pipeline ini yang dibersihkan
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return total
@@ -0,0 +1,153 @@
+"""
+Rotasi Kunci Mini-AES (rekey) dalam Satu Kali Baca
+Fitur:
+1. ECB: dekripsi kunci lama dan enkripsi kunci baru digabung menjadi satu permutasi
+   65.536 entri, sehingga setiap blok cukup satu lookup
+2. CBC: dekripsi dan enkripsi ulang digabung per potongan; plaintext hanya ada sebagai
+   nilai sementara per blok, tidak pernah dikumpulkan atau ditulis
+3. AUTH: seperti CBC, tag lama diverifikasi dan tag baru dihitung dalam pass yang sama
+
+Ciphertext dibaca sekali dan ciphertext baru ditulis sekali, tanpa salinan plaintext.
+"""
+
+import hmac
+import os
+import tempfile
+from array import array
+from contextlib import contextmanager
+from functools import partial
+
+import auth_mode
+from encrypt_decrypt import blocks_to_bytes
+
+KEYSPACE = 1 << 16 # Jumlah nilai blok 16-bit
+CHUNK_SIZE = 64 * 1024
+# Di bawah jumlah blok ini, membangun codebook 2^16 entri lebih mahal dari menghitung langsung
+CODEBOOK_MIN_BLOCKS = 1 << 14
+
+def _block_functions(core, old_key, new_key):
+    """(D_old, E_new) sebagai fungsi blok int -> int memakai jalur cepat."""
+    decrypt = partial(core.decrypt_int, round_keys=core.expand_key_int(old_key))
+    encrypt = partial(core.encrypt_int, round_keys=core.expand_key_int(new_key))
+    return decrypt, encrypt
+
+def ecb_rekey_table(core, old_key, new_key):
+    """Permutasi gabungan T[c] = E_new(D_old(c)) untuk semua 2^16 blok ciphertext."""
+    decrypt, encrypt = _block_functions(core, old_key, new_key)
+    return array('H', map(encrypt, map(decrypt, range(KEYSPACE))))
+
+def ecb_rekey_function(core, old_key, new_key, num_blocks=KEYSPACE):
+    """Fungsi rekey ECB per blok: lookup tabel gabungan untuk input besar, komposisi langsung untuk input kecil."""
+    if num_blocks >= CODEBOOK_MIN_BLOCKS:
+        return ecb_rekey_table(core, old_key, new_key).__getitem__
+    decrypt, encrypt = _block_functions(core, old_key, new_key)
+    return lambda block: encrypt(decrypt(block))
+
+def cbc_rekey_functions(core, old_key, new_key, num_blocks=KEYSPACE):
+    """(D_old, E_new) untuk rekey CBC: codebook penuh untuk input besar, jalur cepat untuk input kecil."""
+    decrypt, encrypt = _block_functions(core, old_key, new_key)
+    if num_blocks >= CODEBOOK_MIN_BLOCKS:
+        decrypt = array('H', map(decrypt, range(KEYSPACE))).__getitem__
+        encrypt = array('H', map(encrypt, range(KEYSPACE))).__getitem__
+    return decrypt, encrypt
+
+def rekey_ecb_blocks(blocks, rekey):
+    """Rekey ECB untuk array blok: satu lookup per blok. Mengembalikan array baru."""
+    return array('H', map(rekey, blocks))
+
+def rekey_cbc_blocks(blocks, decrypt, encrypt, prev_old, prev_new):
+    """
+    Rekey CBC di tempat untuk satu potongan blok.
+
+    prev_old/prev_new adalah blok ciphertext sebelumnya (atau IV) di rantai lama/baru.
+    Mengembalikan (prev_old, prev_new) untuk potongan berikutnya.
+    """
+    for j, c in enumerate(blocks):
+        # p = D_old(c) ^ prev_old; c' = E_new(p ^ prev_new) -- p tidak pernah disimpan
+        prev_new = encrypt(decrypt(c) ^ prev_old ^ prev_new)
+        prev_old = c
+        blocks[j] = prev_new
+    return prev_old, prev_new
+
+# ---- Operasi File ----
+@contextmanager
+def _output_file(input_file, output_file):
+    """
+    File output rekey: ditulis ke file sementara di direktori yang sama lalu di-rename ke
+    `output_file` hanya jika seluruh proses (termasuk verifikasi tag) berhasil. Output lama
+    tidak pernah disentuh saat gagal, dan hasil yang belum terverifikasi tidak pernah muncul
+    di path tujuan. Target yang bukan file biasa (mis. /dev/stdout) ditulis langsung.
+    """
+    if os.path.abspath(input_file) == os.path.abspath(output_file):
+        raise ValueError("File output rekey harus berbeda dari file input.")
+    if os.path.exists(output_file) and not os.path.isfile(output_file):
+        with open(output_file, 'wb') as fout:
+            yield fout
+        return
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output_file)), prefix='.rekey-')
+    try:
+        with os.fdopen(fd, 'wb') as fout:
+            yield fout
+        os.replace(tmp, output_file)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+def _ciphertext_length(fin):
+    """Panjang file ciphertext ECB/CBC (harus kelipatan blok 2 byte)."""
+    fin.seek(0, 2)
+    ct_len = fin.tell()
+    fin.seek(0)
+    if ct_len % 2:
+        raise ValueError("Panjang ciphertext harus kelipatan 2 byte (blok 16-bit).")
+    return ct_len
+
+def rekey_file_ecb(core, input_file, output_file, old_key, new_key, chunk_size=CHUNK_SIZE):
+    """Rekey file ciphertext ECB dalam satu pass. Mengembalikan jumlah byte yang diproses."""
+    with open(input_file, 'rb') as fin:
+        # Ukuran divalidasi sebelum file output dibuat
+        ct_len = _ciphertext_length(fin)
+        rekey = ecb_rekey_function(core, old_key, new_key, ct_len // 2)
+        with _output_file(input_file, output_file) as fout:
+            for blocks in auth_mode.read_block_chunks(fin, ct_len, chunk_size):
+                fout.write(blocks_to_bytes(rekey_ecb_blocks(blocks, rekey)))
+    return ct_len
+
+def rekey_file_cbc(core, input_file, output_file, old_key, new_key, old_iv, new_iv, chunk_size=CHUNK_SIZE):
+    """Rekey file ciphertext CBC (kunci dan/atau IV baru) dalam satu pass."""
+    with open(input_file, 'rb') as fin:
+        ct_len = _ciphertext_length(fin)
+        decrypt, encrypt = cbc_rekey_functions(core, old_key, new_key, ct_len // 2)
+        prev_old, prev_new = old_iv, new_iv
+        with _output_file(input_file, output_file) as fout:
+            for blocks in auth_mode.read_block_chunks(fin, ct_len, chunk_size):
+                prev_old, prev_new = rekey_cbc_blocks(blocks, decrypt, encrypt, prev_old, prev_new)
+                fout.write(blocks_to_bytes(blocks))
+    return ct_len
+
+def rekey_file_auth(core, input_file, output_file, old_key, new_key, old_iv, new_iv,
+                    tag_blocks=auth_mode.DEFAULT_TAG_BLOCKS, chunk_size=CHUNK_SIZE):
+    """
+    Rekey file mode AUTH dalam satu pass: tag lama diverifikasi sambil tag baru dihitung.
+    Output baru muncul di `output_file` hanya jika tag lama cocok; jika tidak, ValueError.
+    """
+    with open(input_file, 'rb') as fin:
+        ct_len, tag_len = auth_mode.split_tag_lengths(fin, tag_blocks)
+        num_blocks = ct_len // 2
+        old_mac = auth_mode.MultiLaneCMAC(core, old_key, tag_blocks, num_blocks)
+        new_mac = auth_mode.MultiLaneCMAC(core, new_key, tag_blocks, num_blocks)
+        old_mac.update([old_iv])
+        new_mac.update([new_iv])
+        decrypt, encrypt = cbc_rekey_functions(core, old_key, new_key, num_blocks)
+        prev_old, prev_new = old_iv, new_iv
+        with _output_file(input_file, output_file) as fout:
+            for blocks in auth_mode.read_block_chunks(fin, ct_len, chunk_size):
+                old_mac.update(blocks)
+                prev_old, prev_new = rekey_cbc_blocks(blocks, decrypt, encrypt, prev_old, prev_new)
+                new_mac.update(blocks)
+                fout.write(blocks_to_bytes(blocks))
+            if not hmac.compare_digest(old_mac.finalize(), fin.read(tag_len)):
+                raise ValueError("Tag autentikasi lama tidak cocok: file ditolak (kunci salah atau data telah dimodifikasi).")
+            fout.write(new_mac.finalize())
+    return ct_len